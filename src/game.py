@@ -45,12 +45,20 @@ from src.config import (
 from src.input.handler import InputHandler
 from src.networking.peer import NetworkPeer
 from src.rendering.renderer import Renderer
-from src.simulation.commands import Command, CommandType
+from src.simulation.commands import COMMAND_ORDER, Command, CommandType
 from src.simulation.state import EntityType, GameState
 from src.simulation.tick import advance_tick
 
 logger = logging.getLogger(__name__)
 
+# Window events after which the whole screen must be presented again
+_REPRESENT_EVENTS = frozenset({
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSIZECHANGED,
+})
+
 
 class GamePhase(Enum):
     CONNECTING = auto()
@@ -80,8 +88,7 @@ class Game:
         self._state = GameState(seed=seed)
         self._setup_initial_state()
         # Compute initial visibility so fog is correct from the start
-        self._state.visibility.update(self._state.entities, 0)
-        self._state.visibility.update(self._state.entities, 1)
+        self._state.visibility.update_all(self._state.entities)
 
         # Camera (pixel offset into the map surface)
         self._camera_x = 0
@@ -99,7 +106,8 @@ class Game:
         self._waiting_for_peer = False
 
         # Rendering interpolation
-        self._prev_positions: list[tuple[int, int]] | None = None
+        # Parallel x / y lists indexed like state.entities
+        self._prev_positions: tuple[list[int], list[int]] | None = None
         self._tick_accumulator_ms: int = 0
         self._last_frame_time_ms: int = pygame.time.get_ticks()
 
@@ -211,12 +219,15 @@ class Game:
                     running = False
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
                     pygame.display.toggle_fullscreen()
+                    self._renderer.invalidate()
                     # Update camera bounds for new screen size
                     tm = self._state.tilemap
                     self._max_camera_x = max(
                         0, tm.width * self._tile_size - self._screen.get_width())
                     self._max_camera_y = max(
                         0, tm.height * self._tile_size - self._screen.get_height())
+                elif event.type in _REPRESENT_EVENTS:
+                    self._renderer.invalidate()
 
             if not running:
                 break
@@ -355,11 +366,14 @@ class Game:
         peer_cmds = self._peer_commands.pop(tick)
 
         # Save positions for interpolation
-        self._prev_positions = [(e.x, e.y) for e in self._state.entities]
+        entities = self._state.entities
+        self._prev_positions = (
+            [e.x for e in entities], [e.y for e in entities],
+        )
 
         # Merge and sort all commands deterministically
         all_cmds = our_cmds + peer_cmds
-        all_cmds.sort(key=lambda c: c.sort_key())
+        all_cmds.sort(key=COMMAND_ORDER)
 
         # Advance simulation
         advance_tick(self._state, all_cmds)
@@ -23,6 +23,10 @@ PLAYER_COLORS = {0: COLOR_PLAYER_1, 1: COLOR_PLAYER_2}
 _MINIMAP_MARGIN = 10
 _MINIMAP_BORDER = (40, 40, 40)
 _MINIMAP_BG = (20, 15, 10)
+# bytes.translate table: visibility state -> minimap fog alpha
+_MINIMAP_FOG_ALPHA = bytes(
+    {UNEXPLORED: 220, FOG: 120}.get(v, 0) for v in range(256)
+)
 
 
 class HUD:
@@ -48,10 +52,8 @@ class HUD:
         # Pre-render terrain
         self._minimap_base = self._build_minimap_terrain(tilemap)
 
-        # Overlay surface for per-frame drawing
-        self._mm_overlay = pygame.Surface(
-            (self._mm_w, self._mm_h), pygame.SRCALPHA,
-        )
+        # Fog overlay, created by the first scale in _draw_minimap_fog
+        self._mm_fog: pygame.Surface | None = None
 
     def _build_minimap_terrain(self, tilemap: TileMap) -> pygame.Surface:
         """Pre-render the minimap terrain surface."""
@@ -98,12 +100,20 @@ class HUD:
         tile_size: int,
         selected_ids: set[int],
         debug_info: dict[str, str],
-    ) -> None:
-        """Draw all HUD elements."""
-        self._draw_minimap(state, player_id, camera_x, camera_y, tile_size)
-        self._draw_resources(state, player_id)
-        self._draw_selection_info(state, selected_ids)
-        self._draw_debug(debug_info)
+    ) -> list[pygame.Rect]:
+        """Draw all HUD elements.
+
+        Returns the screen rects drawn into, for dirty-rect presentation.
+        """
+        rects = [
+            self._draw_minimap(state, player_id, camera_x, camera_y, tile_size),
+            self._draw_resources(state, player_id),
+            self._draw_debug(debug_info),
+        ]
+        panel = self._draw_selection_info(state, selected_ids)
+        if panel is not None:
+            rects.append(panel)
+        return rects
 
     # ---- Minimap ----
 
@@ -114,7 +124,7 @@ class HUD:
         camera_x: int,
         camera_y: int,
         tile_size: int,
-    ) -> None:
+    ) -> pygame.Rect:
         """Draw the minimap with terrain, fog, entities, and viewport rect."""
         # Blit pre-rendered terrain
         self._screen.blit(self._minimap_base, (self._mm_x, self._mm_y))
@@ -129,33 +139,30 @@ class HUD:
         self._draw_minimap_viewport(camera_x, camera_y, tile_size)
 
         # Border
-        pygame.draw.rect(
-            self._screen, _MINIMAP_BORDER,
-            (self._mm_x - 1, self._mm_y - 1, self._mm_w + 2, self._mm_h + 2), 1,
+        border = pygame.Rect(
+            self._mm_x - 1, self._mm_y - 1, self._mm_w + 2, self._mm_h + 2,
         )
+        pygame.draw.rect(self._screen, _MINIMAP_BORDER, border, 1)
+        return border
 
     def _draw_minimap_fog(self, state: GameState, player_id: int) -> None:
         """Draw fog of war on the minimap."""
-        scale = self._mm_scale
-        vis_map = state.visibility
-        fog = self._mm_overlay
-        fog.fill((0, 0, 0, 0))
-
-        for ty in range(self._tilemap.height):
-            for tx in range(self._tilemap.width):
-                vis = vis_map.get_visibility(player_id, tx, ty)
-                if vis == VISIBLE:
-                    continue
-                px = int(tx * scale)
-                py = int(ty * scale)
-                pw = max(1, int((tx + 1) * scale) - px)
-                ph = max(1, int((ty + 1) * scale) - py)
-                if vis == UNEXPLORED:
-                    pygame.draw.rect(fog, (0, 0, 0, 220), (px, py, pw, ph))
-                else:  # FOG
-                    pygame.draw.rect(fog, (0, 0, 0, 120), (px, py, pw, ph))
-
-        self._screen.blit(fog, (self._mm_x, self._mm_y))
+        tw = self._tilemap.width
+        th = self._tilemap.height
+
+        # One black RGBA pixel per tile, alpha taken from its visibility
+        vis = bytes(state.visibility.get_grid(player_id))
+        pixels = bytearray(tw * th * 4)
+        pixels[3::4] = vis.translate(_MINIMAP_FOG_ALPHA)
+        small = pygame.image.frombytes(bytes(pixels), (tw, th), "RGBA")
+
+        # Nearest-neighbour scale to minimap size, reusing the fog surface
+        size = (self._mm_w, self._mm_h)
+        if self._mm_fog is None:
+            self._mm_fog = pygame.transform.scale(small, size)
+        else:
+            pygame.transform.scale(small, size, self._mm_fog)
+        self._screen.blit(self._mm_fog, (self._mm_x, self._mm_y))
 
     def _draw_minimap_entities(self, state: GameState, player_id: int) -> None:
         """Draw entity dots on the minimap."""
@@ -216,7 +223,7 @@ class HUD:
 
     # ---- Resource display ----
 
-    def _draw_resources(self, state: GameState, player_id: int) -> None:
+    def _draw_resources(self, state: GameState, player_id: int) -> pygame.Rect:
         """Draw jelly and ant count at top-right corner."""
         jelly = state.player_jelly.get(player_id, 0)
         ant_count = sum(
@@ -242,6 +249,7 @@ class HUD:
 
         self._screen.blit(jelly_surf, (start_x, 6))
         self._screen.blit(ants_surf, (start_x + jelly_surf.get_width() + 20, 6))
+        return pygame.Rect(start_x - 10, 4, total_w + 20, bar_h + 2)
 
     # ---- Selection panel (bottom of screen) ----
 
@@ -249,10 +257,12 @@ class HUD:
     _CELL_SIZE = 56
     _CELL_PAD = 4
 
-    def _draw_selection_info(self, state: GameState, selected_ids: set[int]) -> None:
+    def _draw_selection_info(
+        self, state: GameState, selected_ids: set[int],
+    ) -> pygame.Rect | None:
         """Draw selection panel at bottom of screen with unit cells."""
         if not selected_ids:
-            return
+            return None
 
         # Collect selected entities (sorted by id for stable layout)
         entities: list[Entity] = []
@@ -261,7 +271,7 @@ class HUD:
             if e is not None:
                 entities.append(e)
         if not entities:
-            return
+            return None
 
         sw = self._screen.get_width()
         sh = self._screen.get_height()
@@ -339,13 +349,18 @@ class HUD:
                 red = min(255, 255 - green)
                 pygame.draw.rect(self._screen, (red, green, 0), (bar_x, bar_y, fill, bar_h))
 
+        return pygame.Rect(panel_x, panel_y, panel_w, panel_h)
+
     # ---- Debug overlay ----
 
-    def _draw_debug(self, debug_info: dict[str, str]) -> None:
+    def _draw_debug(self, debug_info: dict[str, str]) -> pygame.Rect:
         """Draw debug info at top-left."""
         y = 5
+        width = 0
         for key, value in debug_info.items():
             text = f"{key}: {value}"
             surface = self._font.render(text, True, COLOR_DEBUG_TEXT)
             self._screen.blit(surface, (5, y))
+            width = max(width, surface.get_width())
             y += 20
+        return pygame.Rect(5, 5, width, y - 5)
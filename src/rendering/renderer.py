@@ -21,13 +21,73 @@ from src.config import (
 from src.rendering.hud import HUD
 from src.simulation.state import Entity, EntityState, EntityType, GameState
 from src.simulation.tilemap import TileMap, TileType
-from src.simulation.visibility import UNEXPLORED, FOG, VISIBLE
+from src.simulation.visibility import UNEXPLORED, FOG, VISIBLE, VisibilityMap
 
 PLAYER_COLORS = {0: COLOR_PLAYER_1, 1: COLOR_PLAYER_2}
+DEFAULT_COLOR = (200, 200, 200)
+# Half-brightness colors for move target indicators
+DARK_PLAYER_COLORS = {
+    pid: tuple(c // 2 for c in color) for pid, color in PLAYER_COLORS.items()
+}
+DARK_DEFAULT_COLOR = (100, 100, 100)
+# Ant body outlines (player color darkened by 60)
+_PLAYER_OUTLINES = {
+    pid: tuple(max(0, c - 60) for c in color)
+    for pid, color in PLAYER_COLORS.items()
+}
+_DEFAULT_OUTLINE = (140, 140, 140)
+# Memoized _darken results; the palette is small and fixed
+_DARKENED: dict[tuple[tuple, int], tuple] = {}
 ANT_RADIUS = 10
 HIVE_RADIUS = 24
 HIVE_SITE_RADIUS = 16
 MAX_ENTITY_RADIUS = 40  # for culling (mantis arms extend far)
+FOG_ALPHA = 140  # fogged (previously seen) tiles
+# bytes.translate table: visibility state -> fog overlay alpha
+_FOG_ALPHA = bytes(
+    {UNEXPLORED: 255, FOG: FOG_ALPHA}.get(v, 0) for v in range(256)
+)
+MAP_SECTION_TILES = 32  # map surface is split into square sections of this many tiles
+# Side of the cells entities are bucketed into for culling. Entities move
+# far less than a cell per tick, so one cell of margin around the view
+# covers their interpolated positions.
+ENTITY_CELL_TILES = 16
+# Largest extent of an entity sprite plus overlays from its origin (queen crown)
+_DIRTY_RADIUS = 50
+# Frames whose dirty rects cover more than this share of the screen are flipped
+DIRTY_RECT_MAX_FRACTION = 0.25
+
+# Pre-rendered entity sprites. Each is drawn once onto a scratch surface
+# with the entity origin at _BAKE_CENTER, then cropped to its drawn
+# bounds; the cache stores the cropped surface together with the offset
+# from the entity origin to its top-left corner.
+_BAKE_SIZE = 128
+_BAKE_CENTER = _BAKE_SIZE // 2
+# Entity types that never move, so are drawn without interpolation
+_STATIC_TYPES = frozenset(
+    (EntityType.HIVE, EntityType.HIVE_SITE, EntityType.CORPSE)
+)
+CORPSE_DECAY_LEVELS = 8
+CORPSE_JELLY_RADII = (0, 3, 4, 5, 6, 7, 8)  # 0 = no jelly blob
+_SELECTION_RING = ("selection",)
+_ATTACK_RING = ("attack",)
+_SPRITE_CACHE: dict[tuple, tuple[pygame.Surface, int, int]] = {}
+
+# Hexagon vertex directions (pointy-top), and integer vertex offsets
+# memoized per radius
+_HEX_UNIT = tuple(
+    (math.cos(math.pi / 3 * i - math.pi / 6), math.sin(math.pi / 3 * i - math.pi / 6))
+    for i in range(6)
+)
+_HEX_OFFSETS: dict[int, tuple[tuple[int, int], ...]] = {}
+
+# Dirt grain: a pixel is grained when (pixel hash & 7) <= 2. The hash
+# multiplier 2654435761 is 1 mod 8, so the low three bits of the hash are
+# ((row_seed + px) & 7) ^ (0xB55A4F09 & 7) — these are the residues of
+# (row_seed + px) & 7 that produce a grained pixel.
+_GRAIN_RESIDUES = tuple(
+    r for r in range(8) if ((r ^ 0xB55A4F09) & 7) <= 2
+)
 
 
 class Renderer:
@@ -38,10 +98,33 @@ class Renderer:
         self._tile_size = TILE_RENDER_SIZE
         self._font = pygame.font.SysFont("monospace", 16)
         self._map_surface: pygame.Surface | None = None
-        self._fog_surface = pygame.Surface(
-            (screen.get_width(), screen.get_height()), pygame.SRCALPHA,
+        self._map_sections: list[list[pygame.Surface]] = []
+        self._section_px = MAP_SECTION_TILES * self._tile_size
+        # Fog is composed at one pixel per tile over a fixed window of
+        # tiles covering the screen at any camera alignment, then scaled up
+        # into _fog_surface (created on first use in the display format)
+        self._fog_tiles = (
+            screen.get_width() // self._tile_size + 2,
+            screen.get_height() // self._tile_size + 2,
         )
+        self._fog_surface: pygame.Surface | None = None
+        # What _fog_surface was composed from: (grid, player, grid version,
+        # window origin tile); _fog_clear when that window had no fog
+        self._fog_key: tuple[VisibilityMap, int, int, int, int] | None = None
+        self._fog_clear = False
         self._hud: HUD | None = None
+        self._drag_fill: pygame.Surface | None = None
+        # Entity indices bucketed by cell, rebuilt once per sim tick (see
+        # _entities_in_view)
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._cells_entities: list[Entity] | None = None
+        self._cells_key: tuple[int, int] = (-1, -1)
+        # Dirty-rect presentation state (see _present)
+        self._dirty: list[pygame.Rect] = []
+        self._prev_dirty: list[pygame.Rect] = []
+        self._prev_view: tuple[int, int, int] | None = None
+        self._prev_vis: tuple[VisibilityMap, int] | None = None
+        _bake_sprites()
         if tilemap is not None:
             self._build_map_surface(tilemap)
             self._hud = HUD(screen, tilemap)
@@ -54,66 +137,106 @@ class Renderer:
         """Pre-render the entire tile map to a surface.
 
         Uses smooth color blending for dirt and neighbor-aware cliff
-        rendering for rock to eliminate visible grid lines.
+        rendering for rock to eliminate visible grid lines. Dirt tiles
+        are rendered straight into an RGB byte buffer that becomes the
+        map surface in one step; rock tiles are then drawn on top.
         """
         ts = self._tile_size
         w = tilemap.width * ts
         h = tilemap.height * ts
-        self._map_surface = pygame.Surface((w, h))
+        pitch = w * 3
+        buf = bytearray(pitch * h)
 
         # Pre-compute per-tile hash values for smooth blending
         tw, th = tilemap.width, tilemap.height
-        hashes: list[int] = [0] * (tw * th)
-        for y in range(th):
-            for x in range(tw):
-                hashes[y * tw + x] = (
-                    (x * 374761393 + y * 668265263) ^ 0xB55A4F09
-                ) & 0xFFFFFFFF
-
+        # (x * 374761393 + y * 668265263) ^ 0xB55A4F09, masked to 32 bits;
+        # the x and y terms are computed once per column and row
+        x_terms = [x * 374761393 for x in range(tw)]
+        hashes: list[int] = [
+            ((x_term + y_term) ^ 0xB55A4F09) & 0xFFFFFFFF
+            for y_term in range(0, th * 668265263, 668265263)
+            for x_term in x_terms
+        ]
+
+        rock_tiles: list[tuple[int, int]] = []
         for y in range(th):
             for x in range(tw):
                 tile = tilemap.get_tile(x, y)
                 if tile == TileType.DIRT:
-                    self._render_dirt_tile(x, y, tilemap, ts, hashes, tw, th)
+                    self._render_dirt_tile(x, y, tilemap, ts, hashes, tw, buf, pitch)
                 else:
-                    self._render_rock_tile(x, y, tilemap, ts, hashes, tw, th)
+                    rock_tiles.append((x, y))
+
+        self._map_surface = pygame.image.frombytes(bytes(buf), (w, h), "RGB")
+        for x, y in rock_tiles:
+            self._render_rock_tile(x, y, tilemap, ts, hashes, tw, th)
+
+        self._build_map_sections()
+
+    def _build_map_sections(self) -> None:
+        """Split the rendered map into independent section surfaces.
+
+        Each frame only the few sections overlapping the viewport are
+        blitted, so the pixels of far-away parts of the map are never
+        touched. Sections are converted to the display pixel format so
+        those blits are plain copies. The full map surface is released
+        afterwards.
+        """
+        surf = self._map_surface
+        sec = self._section_px
+        w, h = surf.get_size()
+        self._map_sections = [
+            [
+                surf.subsurface(
+                    pygame.Rect(x0, y0, min(sec, w - x0), min(sec, h - y0)),
+                ).convert()
+                for x0 in range(0, w, sec)
+            ]
+            for y0 in range(0, h, sec)
+        ]
+        self._map_surface = None
 
     def _render_dirt_tile(
         self, x: int, y: int, tilemap: TileMap, ts: int,
-        hashes: list[int], tw: int, th: int,
+        hashes: list[int], tw: int, buf: bytearray, pitch: int,
     ) -> None:
-        """Render a dirt tile with pixel-grain texture."""
-        surf = self._map_surface
+        """Render a dirt tile with pixel-grain texture into an RGB buffer."""
         hval = hashes[y * tw + x]
         variation = (hval % 21) - 10
         fine = ((hval >> 16) % 11) - 5
 
         px0 = x * ts
         py0 = y * ts
-
-        # Base fill color
-        base_r = _clamp(101 + variation, 0, 255)
-        base_g = _clamp(76 + variation + fine, 0, 255)
-        base_b = _clamp(38 + variation // 2, 0, 255)
-        pygame.draw.rect(surf, (base_r, base_g, base_b),
-                         (px0, py0, ts, ts))
-
-        # Per-pixel grain: scatter ~30% of pixels with slight variation
+        tile_off = py0 * pitch + px0 * 3
+
+        # Base fill color. variation is -10..10 and fine -5..5, so every
+        # channel (including grain -6..6 below) stays well inside 0..255.
+        base_r = 101 + variation
+        base_g = 76 + variation + fine
+        base_b = 38 + variation // 2
+        base_row = bytes((base_r, base_g, base_b)) * ts
+
+        # The 13 grain shades (grain -6 to +6) as ready-to-copy pixels
+        shades = [
+            bytes((base_r + grain, base_g + grain, base_b + grain // 2))
+            for grain in range(-6, 7)
+        ]
+
+        # Per-pixel grain: scatter ~40% of pixels with slight variation
         # Uses a fast deterministic hash per pixel for the noise pattern
         seed = hval
         for py in range(ts):
+            row = bytearray(base_row)
             row_seed = ((seed + py * 668265263) * 374761393) & 0xFFFFFFFF
-            for px_i in range(ts):
-                # Fast per-pixel hash
-                ph = ((row_seed + px_i * 2654435761) ^ 0xB55A4F09) & 0xFFFFFFFF
-                # Only modify ~40% of pixels for a grainy look
-                if (ph & 7) > 2:
-                    continue
-                grain = ((ph >> 3) % 13) - 6  # -6 to +6
-                r = _clamp(base_r + grain, 0, 255)
-                g = _clamp(base_g + grain, 0, 255)
-                b = _clamp(base_b + grain // 2, 0, 255)
-                surf.set_at((px0 + px_i, py0 + py), (r, g, b))
+            # Whether a pixel is grained depends only on (row_seed + px_i) & 7,
+            # so visit just the grained columns of each residue class
+            for residue in _GRAIN_RESIDUES:
+                for px_i in range((residue - row_seed) & 7, ts, 8):
+                    ph = ((row_seed + px_i * 2654435761) ^ 0xB55A4F09) & 0xFFFFFFFF
+                    i = px_i * 3
+                    row[i:i + 3] = shades[(ph >> 3) % 13]
+            off = tile_off + py * pitch
+            buf[off:off + ts * 3] = row
 
         # Pebble dots near rock edges
         for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
@@ -133,7 +256,8 @@ class Renderer:
                         pdx = (ph >> 8) % ts
                         pdy = ts - 1 - (ph % 6)
                     gray = 75 + ((ph >> 16) % 20)
-                    surf.set_at((px0 + pdx, py0 + pdy), (gray, gray - 5, gray - 3))
+                    off = tile_off + pdy * pitch + pdx * 3
+                    buf[off:off + 3] = bytes((gray, gray - 5, gray - 3))
 
     def _render_rock_tile(
         self, x: int, y: int, tilemap: TileMap, ts: int,
@@ -155,57 +279,45 @@ class Renderer:
 
         is_interior = not (n_dirt or s_dirt or w_dirt or e_dirt)
 
-        # Base rock color — interior is darker
+        # Base rock color — interior is darker. base_gray is 52..88, so all
+        # the shade offsets below (-33..+12) stay inside 0..255.
         if is_interior:
-            base_gray = _clamp(62 + variation, 0, 255)
+            base_gray = 62 + variation
         else:
-            base_gray = _clamp(78 + variation, 0, 255)
+            base_gray = 78 + variation
 
-        base_color = (base_gray, _clamp(base_gray - 3, 0, 255),
-                      _clamp(base_gray - 1, 0, 255))
+        base_color = (base_gray, base_gray - 3, base_gray - 1)
         rect = pygame.Rect(px0, py0, ts, ts)
-        pygame.draw.rect(surf, base_color, rect)
+        surf.fill(base_color, rect)
 
         # Cliff edges on exposed sides
         edge_w = max(3, ts // 8)  # 4px at ts=32
 
         if n_dirt:
             # Top edge: dark shadow at top, lighter below
-            shadow = (_clamp(base_gray - 25, 0, 255),
-                      _clamp(base_gray - 28, 0, 255),
-                      _clamp(base_gray - 22, 0, 255))
-            highlight = (_clamp(base_gray + 8, 0, 255),
-                         _clamp(base_gray + 5, 0, 255),
-                         _clamp(base_gray + 7, 0, 255))
-            pygame.draw.rect(surf, shadow, (px0, py0, ts, 2))
-            pygame.draw.rect(surf, highlight, (px0, py0 + 2, ts, edge_w - 2))
+            shadow = (base_gray - 25, base_gray - 28, base_gray - 22)
+            highlight = (base_gray + 8, base_gray + 5, base_gray + 7)
+            surf.fill(shadow, (px0, py0, ts, 2))
+            surf.fill(highlight, (px0, py0 + 2, ts, edge_w - 2))
 
         if s_dirt:
             # Bottom edge: lighter highlight at bottom
-            highlight = (_clamp(base_gray + 12, 0, 255),
-                         _clamp(base_gray + 9, 0, 255),
-                         _clamp(base_gray + 10, 0, 255))
-            pygame.draw.rect(surf, highlight,
-                             (px0, py0 + ts - edge_w, ts, edge_w))
+            highlight = (base_gray + 12, base_gray + 9, base_gray + 10)
+            surf.fill(highlight,
+                      (px0, py0 + ts - edge_w, ts, edge_w))
 
         if w_dirt:
             # Left edge: shadow
-            shadow = (_clamp(base_gray - 18, 0, 255),
-                      _clamp(base_gray - 20, 0, 255),
-                      _clamp(base_gray - 16, 0, 255))
-            pygame.draw.rect(surf, shadow, (px0, py0, 2, ts))
-            lighter = (_clamp(base_gray + 4, 0, 255),
-                       _clamp(base_gray + 1, 0, 255),
-                       _clamp(base_gray + 3, 0, 255))
-            pygame.draw.rect(surf, lighter, (px0 + 2, py0, edge_w - 2, ts))
+            shadow = (base_gray - 18, base_gray - 20, base_gray - 16)
+            surf.fill(shadow, (px0, py0, 2, ts))
+            lighter = (base_gray + 4, base_gray + 1, base_gray + 3)
+            surf.fill(lighter, (px0 + 2, py0, edge_w - 2, ts))
 
         if e_dirt:
             # Right edge: highlight
-            highlight = (_clamp(base_gray + 6, 0, 255),
-                         _clamp(base_gray + 3, 0, 255),
-                         _clamp(base_gray + 5, 0, 255))
-            pygame.draw.rect(surf, highlight,
-                             (px0 + ts - edge_w, py0, edge_w, ts))
+            highlight = (base_gray + 6, base_gray + 3, base_gray + 5)
+            surf.fill(highlight,
+                      (px0 + ts - edge_w, py0, edge_w, ts))
 
         # Corner darkening where two edges meet
         corner_size = edge_w
@@ -214,37 +326,35 @@ class Renderer:
         sw_dirt = tilemap.get_tile(x - 1, y + 1) == TileType.DIRT
         se_dirt = tilemap.get_tile(x + 1, y + 1) == TileType.DIRT
 
-        corner_dark = (_clamp(base_gray - 30, 0, 255),
-                       _clamp(base_gray - 33, 0, 255),
-                       _clamp(base_gray - 28, 0, 255))
+        corner_dark = (base_gray - 30, base_gray - 33, base_gray - 28)
 
         if n_dirt and w_dirt:
-            pygame.draw.rect(surf, corner_dark,
-                             (px0, py0, corner_size, corner_size))
+            surf.fill(corner_dark,
+                      (px0, py0, corner_size, corner_size))
         if n_dirt and e_dirt:
-            pygame.draw.rect(surf, corner_dark,
-                             (px0 + ts - corner_size, py0,
-                              corner_size, corner_size))
+            surf.fill(corner_dark,
+                      (px0 + ts - corner_size, py0,
+                       corner_size, corner_size))
         if s_dirt and w_dirt:
-            pygame.draw.rect(surf, corner_dark,
-                             (px0, py0 + ts - corner_size,
-                              corner_size, corner_size))
+            surf.fill(corner_dark,
+                      (px0, py0 + ts - corner_size,
+                       corner_size, corner_size))
         if s_dirt and e_dirt:
-            pygame.draw.rect(surf, corner_dark,
-                             (px0 + ts - corner_size,
-                              py0 + ts - corner_size,
-                              corner_size, corner_size))
+            surf.fill(corner_dark,
+                      (px0 + ts - corner_size,
+                       py0 + ts - corner_size,
+                       corner_size, corner_size))
 
         # Inner corner shadows (rock surrounded on 3 sides, diagonal exposed)
         if not n_dirt and not w_dirt and nw_dirt:
-            pygame.draw.rect(surf, corner_dark, (px0, py0, 3, 3))
+            surf.fill(corner_dark, (px0, py0, 3, 3))
         if not n_dirt and not e_dirt and ne_dirt:
-            pygame.draw.rect(surf, corner_dark, (px0 + ts - 3, py0, 3, 3))
+            surf.fill(corner_dark, (px0 + ts - 3, py0, 3, 3))
         if not s_dirt and not w_dirt and sw_dirt:
-            pygame.draw.rect(surf, corner_dark, (px0, py0 + ts - 3, 3, 3))
+            surf.fill(corner_dark, (px0, py0 + ts - 3, 3, 3))
         if not s_dirt and not e_dirt and se_dirt:
-            pygame.draw.rect(surf, corner_dark,
-                             (px0 + ts - 3, py0 + ts - 3, 3, 3))
+            surf.fill(corner_dark,
+                      (px0 + ts - 3, py0 + ts - 3, 3, 3))
 
         # Crack texture on rock surface
         for i in range(2):
@@ -253,9 +363,7 @@ class Renderer:
             cy = ((ch >> 8) % (ts - 6)) + 3
             clen = 3 + ((ch >> 16) % 5)
             cdir = (ch >> 20) % 4
-            crack_color = (_clamp(base_gray - 20, 0, 255),
-                           _clamp(base_gray - 22, 0, 255),
-                           _clamp(base_gray - 18, 0, 255))
+            crack_color = (base_gray - 20, base_gray - 22, base_gray - 18)
             if cdir == 0:  # horizontal
                 pygame.draw.line(surf, crack_color,
                                  (px0 + cx, py0 + cy),
@@ -273,7 +381,7 @@ class Renderer:
     def draw(
         self,
         state: GameState,
-        prev_entities: list[tuple[int, int]] | None,
+        prev_entities: tuple[list[int], list[int]] | None,
         interp: float,
         debug_info: dict[str, str],
         camera_x: int = 0,
@@ -293,21 +401,72 @@ class Renderer:
         if drag_rect:
             self._draw_drag_rect(drag_rect)
         if self._hud:
-            self._hud.draw(
+            self._dirty.extend(self._hud.draw(
                 state, player_id, camera_x, camera_y,
                 self._tile_size, selected_ids or set(), debug_info,
-            )
-        pygame.display.flip()
+            ))
+        self._present(state, camera_x, camera_y, player_id)
+
+    def invalidate(self) -> None:
+        """Make the next frame a full flip.
+
+        For when the window surface is replaced or exposed (fullscreen
+        toggle, expose/restore/resize events) and the whole screen has to
+        be presented again, even with an unchanged view.
+        """
+        self._prev_view = None
+
+    def _present(
+        self, state: GameState, camera_x: int, camera_y: int, player_id: int,
+    ) -> None:
+        """Push the frame to the display.
+
+        When the view and fog are unchanged since the last frame, only the
+        rects drawn into this frame and the last (entities, overlays, HUD)
+        can differ, so those are updated alone — as long as they cover
+        less than DIRTY_RECT_MAX_FRACTION of the screen. Anything bigger
+        is cheaper as a full flip.
+        """
+        dirty = self._dirty
+        rects = dirty + self._prev_dirty
+        self._prev_dirty = dirty
+        self._dirty = []
+
+        view = (camera_x, camera_y, player_id)
+        vis_map = state.visibility
+        vis = (vis_map, vis_map.get_version(player_id))
+        full = view != self._prev_view or vis != self._prev_vis
+        self._prev_view = view
+        self._prev_vis = vis
+
+        if not full:
+            area = 0
+            for rect in rects:
+                area += rect.w * rect.h
+            screen_area = self._screen.get_width() * self._screen.get_height()
+            full = area >= screen_area * DIRTY_RECT_MAX_FRACTION
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
 
     def _draw_tiles(self, camera_x: int, camera_y: int) -> None:
-        """Blit the pre-rendered map surface with camera offset."""
-        if self._map_surface is None:
+        """Blit the pre-rendered map sections visible under the camera."""
+        sections = self._map_sections
+        if not sections:
             return
         sw = self._screen.get_width()
         sh = self._screen.get_height()
-        # Source rect: which part of the map to show
-        src = pygame.Rect(camera_x, camera_y, sw, sh)
-        self._screen.blit(self._map_surface, (0, 0), src)
+        sec = self._section_px
+        row0 = max(0, camera_y // sec)
+        row1 = min(len(sections), (camera_y + sh - 1) // sec + 1)
+        col0 = max(0, camera_x // sec)
+        col1 = min(len(sections[0]), (camera_x + sw - 1) // sec + 1)
+        for row in range(row0, row1):
+            oy = row * sec - camera_y
+            row_sections = sections[row]
+            for col in range(col0, col1):
+                self._screen.blit(row_sections[col], (col * sec - camera_x, oy))
 
     def _draw_fog(
         self,
@@ -318,87 +477,199 @@ class Renderer:
     ) -> None:
         """Draw fog of war overlay. UNEXPLORED=black, FOG=semi-transparent."""
         ts = self._tile_size
-        sw = self._screen.get_width()
-        sh = self._screen.get_height()
         vis_map = state.visibility
-
-        fog = self._fog_surface
-        fog.fill((0, 0, 0, 0))
-
         start_tx = camera_x // ts
         start_ty = camera_y // ts
-        end_tx = (camera_x + sw) // ts + 1
-        end_ty = (camera_y + sh) // ts + 1
 
-        for ty in range(start_ty, end_ty):
-            for tx in range(start_tx, end_tx):
-                vis = vis_map.get_visibility(player_id, tx, ty)
-                if vis == VISIBLE:
-                    continue
-                px = tx * ts - camera_x
-                py = ty * ts - camera_y
-                if vis == UNEXPLORED:
-                    pygame.draw.rect(fog, (0, 0, 0, 255), (px, py, ts, ts))
-                else:  # FOG
-                    pygame.draw.rect(fog, (0, 0, 0, 140), (px, py, ts, ts))
+        # Recompose only when the grid or the window of tiles has changed;
+        # camera moves within a tile just shift the blit
+        key = (vis_map, player_id, vis_map.get_version(player_id),
+               start_tx, start_ty)
+        if key != self._fog_key:
+            self._fog_key = key
+            self._compose_fog(vis_map, player_id, start_tx, start_ty)
+        if self._fog_clear:
+            return
+        self._screen.blit(
+            self._fog_surface, (start_tx * ts - camera_x, start_ty * ts - camera_y),
+        )
+
+    def _compose_fog(
+        self, vis_map: VisibilityMap, player_id: int, start_tx: int, start_ty: int,
+    ) -> None:
+        """Compose the fog overlay for the window of tiles at start_tx/ty."""
+        ts = self._tile_size
+        cols, rows = self._fog_tiles
+
+        # One black RGBA pixel per tile, alpha taken from its visibility
+        alphas = b"".join(
+            vis_map.get_row(player_id, ty, start_tx, start_tx + cols)
+            for ty in range(start_ty, start_ty + rows)
+        ).translate(_FOG_ALPHA)
 
-        self._screen.blit(fog, (0, 0))
+        # Fully revealed window (common later in the game): nothing to draw
+        self._fog_clear = alphas.count(0) == len(alphas)
+        if self._fog_clear:
+            return
+
+        pixels = bytearray(cols * rows * 4)
+        pixels[3::4] = alphas
+        small = pygame.image.frombytes(
+            bytes(pixels), (cols, rows), "RGBA",
+        ).convert_alpha()
+
+        # Nearest-neighbour scale to tile size, reusing the fog surface
+        size = (cols * ts, rows * ts)
+        if self._fog_surface is None:
+            self._fog_surface = pygame.transform.scale(small, size)
+        else:
+            pygame.transform.scale(small, size, self._fog_surface)
+
+    def _entities_in_view(
+        self, state: GameState, camera_x: int, camera_y: int,
+    ) -> list[int]:
+        """Indices of entities in the cells around the view, in list order.
+
+        Entities only move when the simulation ticks, so the cell buckets
+        are rebuilt when the tick (or the entity list) changes and reused
+        by every frame in between. Keeping list order keeps draw order.
+        """
+        entities = state.entities
+        key = (state.tick, len(entities))
+        if entities is not self._cells_entities or key != self._cells_key:
+            cell_mt = ENTITY_CELL_TILES * MILLI_TILES_PER_TILE
+            cells: dict[tuple[int, int], list[int]] = {}
+            for i, entity in enumerate(entities):
+                cell = (entity.x // cell_mt, entity.y // cell_mt)
+                bucket = cells.get(cell)
+                if bucket is None:
+                    cells[cell] = [i]
+                else:
+                    bucket.append(i)
+            self._cells = cells
+            self._cells_entities = entities
+            self._cells_key = key
+
+        cells = self._cells
+        cell_px = ENTITY_CELL_TILES * self._tile_size
+        r = MAX_ENTITY_RADIUS
+        cx0 = (camera_x - r) // cell_px - 1
+        cx1 = (camera_x + self._screen.get_width() + r) // cell_px + 1
+        cy0 = (camera_y - r) // cell_px - 1
+        cy1 = (camera_y + self._screen.get_height() + r) // cell_px + 1
+        indices: list[int] = []
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    indices.extend(bucket)
+        indices.sort()
+        return indices
 
     def _draw_entities(
         self,
         state: GameState,
-        prev_positions: list[tuple[int, int]] | None,
+        prev_positions: tuple[list[int], list[int]] | None,
         interp: float,
         camera_x: int,
         camera_y: int,
         player_id: int = 0,
         selected_ids: set[int] | None = None,
     ) -> None:
-        sw = self._screen.get_width()
-        sh = self._screen.get_height()
+        # Hot loop: hoist attribute and global lookups into locals
+        screen = self._screen
+        ts = self._tile_size
+        mtpt = MILLI_TILES_PER_TILE
         r = MAX_ENTITY_RADIUS
+        max_sx = screen.get_width() + r
+        max_sy = screen.get_height() + r
         vis_map = state.visibility
+        vis_grid = vis_map.get_grid(player_id)
+        vis_w = vis_map.width
+        vis_h = vis_map.height
+
+        # Entities spawned since the snapshot (index >= n_prev) are drawn
+        # at their current position
+        if prev_positions is not None:
+            prev_xs, prev_ys = prev_positions
+            n_prev = len(prev_xs)
+        else:
+            n_prev = 0
+
+        # Interpolation factor in 8-bit fixed point: integer math per entity
+        iq = int(interp * 256)
+
+        visible: list[tuple[Entity, int, int, bool]] = []
+        dirty = self._dirty
+        d = _DIRTY_RADIUS
+        sprite_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+        entities = state.entities
+        for i in self._entities_in_view(state, camera_x, camera_y):
+            entity = entities[i]
+            draw_x = entity.x
+            draw_y = entity.y
+            if i < n_prev and entity.entity_type not in _STATIC_TYPES:
+                px = prev_xs[i]
+                py = prev_ys[i]
+                draw_x = px + ((draw_x - px) * iq >> 8)
+                draw_y = py + ((draw_y - py) * iq >> 8)
+
+            # Convert milli-tiles to screen pixels, apply camera offset
+            sx = draw_x * ts // mtpt - camera_x
+            sy = draw_y * ts // mtpt - camera_y
 
-        for i, entity in enumerate(state.entities):
-            if prev_positions is not None and i < len(prev_positions):
-                px, py = prev_positions[i]
-                draw_x = int(px + (entity.x - px) * interp)
-                draw_y = int(py + (entity.y - py) * interp)
-            else:
-                draw_x = entity.x
-                draw_y = entity.y
+            # Cull off-screen entities (cheap arithmetic, so before the
+            # visibility lookup — most entities fail here on big maps)
+            if sx < -r or sx > max_sx or sy < -r or sy > max_sy:
+                continue
 
             # Hide non-own entities in non-VISIBLE tiles
             if entity.player_id != player_id:
-                tile_x = draw_x // MILLI_TILES_PER_TILE
-                tile_y = draw_y // MILLI_TILES_PER_TILE
-                if vis_map.get_visibility(player_id, tile_x, tile_y) != VISIBLE:
+                tile_x = draw_x // mtpt
+                tile_y = draw_y // mtpt
+                if (
+                    tile_x < 0 or tile_x >= vis_w or tile_y < 0 or tile_y >= vis_h
+                    or vis_grid[tile_y * vis_w + tile_x] != VISIBLE
+                ):
                     continue
 
-            # Convert milli-tiles to screen pixels, apply camera offset
-            sx = draw_x * self._tile_size // MILLI_TILES_PER_TILE - camera_x
-            sy = draw_y * self._tile_size // MILLI_TILES_PER_TILE - camera_y
+            sprite = _entity_sprite(entity)
+            if sprite is not None:
+                surf, ox, oy = sprite
+                sprite_blits.append((surf, (sx + ox, sy + oy)))
+            visible.append((entity, sx, sy, sprite is None))
+            dirty.append(pygame.Rect(sx - d, sy - d, 2 * d, 2 * d))
 
-            # Cull off-screen entities
-            if sx < -r or sx > sw + r or sy < -r or sy > sh + r:
-                continue
+        # All sprite-cached entity bodies go out in a single batched blit;
+        # overlays (and any entity without a sprite) are drawn on top
+        screen.blits(sprite_blits, doreturn=False)
 
-            self._draw_entity(entity, sx, sy, camera_x, camera_y)
+        ring, ring_dx, ring_dy = _SPRITE_CACHE[_SELECTION_RING]
+        ring_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for entity, sx, sy, draw_body in visible:
+            self._draw_entity(entity, sx, sy, draw_body)
 
-            # Selection highlight
+            # Selection highlight (batched, drawn after all overlays)
             if selected_ids and entity.entity_id in selected_ids:
-                pygame.draw.circle(
-                    self._screen, (0, 220, 0), (sx, sy), ANT_RADIUS + 16, 3,
-                )
+                ring_blits.append((ring, (sx + ring_dx, sy + ring_dy)))
 
             # Draw target indicator if moving
             if entity.is_moving and entity.player_id >= 0:
-                tx = entity.target_x * self._tile_size // MILLI_TILES_PER_TILE - camera_x
-                ty = entity.target_y * self._tile_size // MILLI_TILES_PER_TILE - camera_y
-                color = PLAYER_COLORS.get(entity.player_id, (200, 200, 200))
-                target_color = tuple(c // 2 for c in color)
-                pygame.draw.circle(self._screen, target_color, (tx, ty), 8)
-                pygame.draw.line(self._screen, target_color, (sx, sy), (tx, ty), 1)
+                tx = entity.target_x * ts // mtpt - camera_x
+                ty = entity.target_y * ts // mtpt - camera_y
+                target_color = DARK_PLAYER_COLORS.get(
+                    entity.player_id, DARK_DEFAULT_COLOR,
+                )
+                pygame.draw.circle(screen, target_color, (tx, ty), 8)
+                pygame.draw.line(screen, target_color, (sx, sy), (tx, ty), 1)
+                dirty.append(pygame.Rect(
+                    min(sx, tx) - 9, min(sy, ty) - 9,
+                    abs(tx - sx) + 18, abs(ty - sy) + 18,
+                ))
+
+        if ring_blits:
+            screen.blits(ring_blits, doreturn=False)
 
     def _draw_drag_rect(self, drag_rect: tuple[int, int, int, int]) -> None:
         """Draw the selection drag rectangle (green translucent)."""
@@ -409,73 +680,162 @@ class Renderer:
         rh = abs(y2 - y1)
         if rw < 2 or rh < 2:
             return
-        rect_surf = pygame.Surface((rw, rh), pygame.SRCALPHA)
-        rect_surf.fill((0, 200, 0, 40))
-        self._screen.blit(rect_surf, (rx, ry))
+        # A screen-sized translucent fill made on the first drag; each frame
+        # blits just the part the rectangle needs
+        if self._drag_fill is None:
+            self._drag_fill = pygame.Surface(
+                self._screen.get_size(), pygame.SRCALPHA,
+            )
+            self._drag_fill.fill((0, 200, 0, 40))
+        self._screen.blit(self._drag_fill, (rx, ry), (0, 0, rw, rh))
         pygame.draw.rect(self._screen, (0, 220, 0), (rx, ry, rw, rh), 1)
+        self._dirty.append(pygame.Rect(rx, ry, rw, rh))
 
     def _draw_entity(
-        self, entity: Entity, sx: int, sy: int,
-        camera_x: int, camera_y: int,
+        self, entity: Entity, sx: int, sy: int, draw_body: bool = True,
     ) -> None:
-        """Draw a single entity at screen position (sx, sy)."""
+        """Draw a single entity at screen position (sx, sy).
+
+        With draw_body=False only the overlays (attack flash, health bar)
+        are drawn — used for entities whose sprite was already blitted.
+        """
         etype = entity.entity_type
         s = self._screen
 
-        if etype == EntityType.ANT:
-            _draw_ant(s, sx, sy, entity, large=False)
-        elif etype == EntityType.QUEEN:
-            _draw_ant(s, sx, sy, entity, large=True)
-        elif etype == EntityType.HIVE:
-            color = PLAYER_COLORS.get(entity.player_id, (200, 200, 200))
-            _draw_hexagon(s, sx, sy, 32, color)
-            _draw_hexagon(s, sx, sy, 16, _darken(color, 40))
-            _draw_hexagon(s, sx, sy, 32, (0, 0, 0), width=3)
-        elif etype == EntityType.HIVE_SITE:
-            _draw_hexagon(s, sx, sy, 24, (100, 100, 100))
-            _draw_hexagon(s, sx, sy, 24, (60, 60, 60), width=3)
-        elif etype == EntityType.CORPSE:
-            _draw_corpse(s, sx, sy, entity)
-        elif etype == EntityType.APHID:
-            _draw_aphid(s, sx, sy)
-        elif etype == EntityType.BEETLE:
-            _draw_beetle(s, sx, sy)
-        elif etype == EntityType.MANTIS:
-            _draw_mantis(s, sx, sy)
-        elif etype == EntityType.SPITTER:
-            _draw_spitter(s, sx, sy, entity)
+        if draw_body:
+            # Only entities without a baked sprite (unknown players) get here
+            if etype == EntityType.ANT:
+                _draw_ant(s, sx, sy, entity, large=False)
+            elif etype == EntityType.QUEEN:
+                _draw_ant(s, sx, sy, entity, large=True)
+            elif etype == EntityType.HIVE:
+                _draw_hive(s, sx, sy, PLAYER_COLORS.get(entity.player_id, DEFAULT_COLOR))
+            elif etype == EntityType.SPITTER:
+                _draw_spitter(s, sx, sy, entity)
 
         # Attack flash
         if entity.state == EntityState.ATTACKING:
-            pygame.draw.circle(s, (255, 60, 60), (sx, sy), ANT_RADIUS + 12, 3)
+            ring, ring_dx, ring_dy = _SPRITE_CACHE[_ATTACK_RING]
+            s.blit(ring, (sx + ring_dx, sy + ring_dy))
 
         # Health bar for damaged units
         if entity.hp < entity.max_hp and entity.max_hp > 0:
             bar_w, bar_h = 40, 5
             bx = sx - bar_w // 2
             by = sy - 36
-            pygame.draw.rect(s, (60, 0, 0), (bx, by, bar_w, bar_h))
+            _fill_clipped(s, (60, 0, 0), bx, by, bar_w, bar_h)
             fill = max(1, entity.hp * bar_w // entity.max_hp)
-            pygame.draw.rect(s, (0, 200, 0), (bx, by, fill, bar_h))
+            _fill_clipped(s, (0, 200, 0), bx, by, fill, bar_h)
+
+
+def _bake_sprites() -> None:
+    """Pre-render the entity sprites into _SPRITE_CACHE.
+
+    Requires the display mode to be set (sprites are converted to the
+    display format). Runs once; later calls are no-ops.
+    """
+    if _SPRITE_CACHE:
+        return
+
+    def bake(draw_fn, *args) -> tuple[pygame.Surface, int, int]:
+        surf = pygame.Surface((_BAKE_SIZE, _BAKE_SIZE), pygame.SRCALPHA)
+        draw_fn(surf, _BAKE_CENTER, _BAKE_CENTER, *args)
+        bounds = surf.get_bounding_rect()
+        sprite = surf.subsurface(bounds).copy().convert_alpha()
+        return sprite, bounds.x - _BAKE_CENTER, bounds.y - _BAKE_CENTER
+
+    _SPRITE_CACHE[_SELECTION_RING] = bake(_draw_ring, (0, 220, 0), ANT_RADIUS + 16)
+    _SPRITE_CACHE[_ATTACK_RING] = bake(_draw_ring, (255, 60, 60), ANT_RADIUS + 12)
+    _SPRITE_CACHE[(EntityType.HIVE_SITE,)] = bake(_draw_hive_site)
+    _SPRITE_CACHE[(EntityType.APHID,)] = bake(_draw_aphid)
+    _SPRITE_CACHE[(EntityType.BEETLE,)] = bake(_draw_beetle)
+    _SPRITE_CACHE[(EntityType.MANTIS,)] = bake(_draw_mantis)
+    for pid, color in PLAYER_COLORS.items():
+        outline = _PLAYER_OUTLINES[pid]
+        for carrying in (False, True):
+            _SPRITE_CACHE[(EntityType.ANT, pid, carrying)] = bake(
+                _draw_ant_body, color, outline, False, carrying,
+            )
+            _SPRITE_CACHE[(EntityType.QUEEN, pid, carrying)] = bake(
+                _draw_ant_body, color, outline, True, carrying,
+            )
+        _SPRITE_CACHE[(EntityType.HIVE, pid)] = bake(_draw_hive, color)
+        _SPRITE_CACHE[(EntityType.SPITTER, pid)] = bake(_draw_spitter_body, color)
+    for jelly_r in CORPSE_JELLY_RADII:
+        for level in range(CORPSE_DECAY_LEVELS):
+            decay_frac = level / (CORPSE_DECAY_LEVELS - 1)
+            _SPRITE_CACHE[(EntityType.CORPSE, jelly_r, level)] = bake(
+                _draw_corpse, decay_frac, jelly_r,
+            )
 
 
+def _entity_sprite(entity: Entity) -> tuple[pygame.Surface, int, int] | None:
+    """Return the cached (sprite, dx, dy) for an entity, or None if it is drawn live."""
+    etype = entity.entity_type
+    if etype == EntityType.ANT or etype == EntityType.QUEEN:
+        return _SPRITE_CACHE.get((etype, entity.player_id, entity.carrying > 0))
+    if etype == EntityType.CORPSE:
+        level = min(
+            CORPSE_DECAY_LEVELS - 1,
+            entity.hp * (CORPSE_DECAY_LEVELS - 1) // max(entity.max_hp, 1),
+        )
+        return _SPRITE_CACHE[
+            (EntityType.CORPSE, _corpse_jelly_radius(entity.jelly_value), level)
+        ]
+    if etype == EntityType.HIVE or etype == EntityType.SPITTER:
+        return _SPRITE_CACHE.get((etype, entity.player_id))
+    return _SPRITE_CACHE.get((etype,))
+
+
+def _corpse_jelly_radius(jelly_value: int) -> int:
+    """Radius of the jelly blob drawn on a corpse (0 when empty)."""
+    if jelly_value <= 0:
+        return 0
+    return min(8, 3 + jelly_value // 5)
+
 
 def _draw_hexagon(
     surface: pygame.Surface, cx: int, cy: int, radius: int,
     color: tuple, width: int = 0,
 ) -> None:
     """Draw a hexagon centered at (cx, cy)."""
-    points = []
-    for i in range(6):
-        angle = math.pi / 3 * i - math.pi / 6
-        px = cx + int(radius * math.cos(angle))
-        py = cy + int(radius * math.sin(angle))
-        points.append((px, py))
+    offsets = _HEX_OFFSETS.get(radius)
+    if offsets is None:
+        offsets = tuple(
+            (int(radius * ux), int(radius * uy)) for ux, uy in _HEX_UNIT
+        )
+        _HEX_OFFSETS[radius] = offsets
+    points = [(cx + dx, cy + dy) for dx, dy in offsets]
     pygame.draw.polygon(surface, color, points, width)
 
 
+def _draw_ring(
+    surface: pygame.Surface, sx: int, sy: int, color: tuple, radius: int,
+) -> None:
+    """Draw a 3px highlight ring (selection / attack flash)."""
+    pygame.draw.circle(surface, color, (sx, sy), radius, 3)
+
+
+def _draw_hive(surface: pygame.Surface, sx: int, sy: int, color: tuple) -> None:
+    """Draw a player hive — nested hexagons in the player color."""
+    _draw_hexagon(surface, sx, sy, 32, color)
+    _draw_hexagon(surface, sx, sy, 16, _darken(color, 40))
+    _draw_hexagon(surface, sx, sy, 32, (0, 0, 0), width=3)
+
+
+def _draw_hive_site(surface: pygame.Surface, sx: int, sy: int) -> None:
+    """Draw an unclaimed hive site."""
+    _draw_hexagon(surface, sx, sy, 24, (100, 100, 100))
+    _draw_hexagon(surface, sx, sy, 24, (60, 60, 60), width=3)
+
+
 def _darken(color: tuple, amount: int) -> tuple:
-    return tuple(max(0, c - amount) for c in color)
+    key = (color, amount)
+    dark = _DARKENED.get(key)
+    if dark is None:
+        dark = tuple(max(0, c - amount) for c in color)
+        _DARKENED[key] = dark
+    return dark
 
 
 def _draw_ant(
@@ -483,9 +843,19 @@ def _draw_ant(
     entity: Entity, large: bool,
 ) -> None:
     """Draw an ant (or queen) with body segments, legs, and antennae."""
-    color = PLAYER_COLORS.get(entity.player_id, (200, 200, 200))
-    outline = _darken(color, 60)
+    _draw_ant_body(
+        surface, sx, sy,
+        PLAYER_COLORS.get(entity.player_id, DEFAULT_COLOR),
+        _PLAYER_OUTLINES.get(entity.player_id, _DEFAULT_OUTLINE),
+        large, entity.carrying > 0,
+    )
+
 
+def _draw_ant_body(
+    surface: pygame.Surface, sx: int, sy: int,
+    color: tuple, outline: tuple, large: bool, carrying: bool,
+) -> None:
+    """Draw an ant body centred on (sx, sy) onto surface (e.g. a bake surface)."""
     if large:
         # Queen: bigger body
         body_w, body_h = 24, 32
@@ -546,7 +916,7 @@ def _draw_ant(
             ])
 
     # Jelly indicator — only show when actually carrying jelly
-    if entity.carrying > 0:
+    if carrying:
         pygame.draw.circle(surface, (240, 220, 60), (sx, sy + body_h + 4), 6)
 
 
@@ -554,7 +924,14 @@ def _draw_spitter(
     surface: pygame.Surface, sx: int, sy: int, entity: Entity,
 ) -> None:
     """Draw a spitter ant — like a regular ant but with a green poison sac."""
-    color = PLAYER_COLORS.get(entity.player_id, (200, 200, 200))
+    color = PLAYER_COLORS.get(entity.player_id, DEFAULT_COLOR)
+    _draw_spitter_body(surface, sx, sy, color)
+
+
+def _draw_spitter_body(
+    surface: pygame.Surface, sx: int, sy: int, color: tuple,
+) -> None:
+    """Draw a spitter body centred on (sx, sy) onto surface (e.g. a bake surface)."""
     outline = _darken(color, 60)
     poison = (80, 200, 40)
 
@@ -593,11 +970,14 @@ def _draw_spitter(
 
 
 def _draw_corpse(
-    surface: pygame.Surface, sx: int, sy: int, entity: Entity,
+    surface: pygame.Surface, sx: int, sy: int,
+    decay_frac: float, jelly_r: int,
 ) -> None:
-    """Draw a dead ant corpse — legs splayed out, with jelly indicator."""
-    # Fade as decay progresses (hp counts down from max_hp)
-    decay_frac = entity.hp / max(entity.max_hp, 1)
+    """Draw a dead ant corpse — legs splayed out, with jelly indicator.
+
+    decay_frac fades from 1.0 (fresh) to 0.0 (about to vanish); jelly_r
+    is the radius of the jelly blob, 0 for none.
+    """
     gray = max(60, int(180 * decay_frac))
     c = (gray, max(0, gray - 10), max(0, gray - 20))
     dark = (max(0, gray - 30), max(0, gray - 40), max(0, gray - 50))
@@ -613,9 +993,7 @@ def _draw_corpse(
         pygame.draw.line(surface, dark, (sx, sy), (sx + dx, sy + dy), 2)
         pygame.draw.line(surface, dark, (sx, sy), (sx - dx, sy + dy), 2)
     # Jelly indicator — golden blob showing harvestable value
-    if entity.jelly_value > 0:
-        jelly_r = min(8, 3 + entity.jelly_value // 5)
-        glow = (220, 190, 40, 160)
+    if jelly_r > 0:
         # Draw a filled golden circle
         pygame.draw.circle(surface, (200, 170, 30), (sx, sy - 12), jelly_r)
         pygame.draw.circle(surface, (240, 210, 60), (sx, sy - 12), max(1, jelly_r - 2))
@@ -691,9 +1069,19 @@ def _draw_mantis(surface: pygame.Surface, sx: int, sy: int) -> None:
         pygame.draw.line(surface, dark, (sx + 8, sy + dy), (sx + 18, sy + dy + 10), 1)
 
 
-def _clamp(val: int, lo: int, hi: int) -> int:
-    if val < lo:
-        return lo
-    if val > hi:
-        return hi
-    return val
+def _fill_clipped(
+    surface: pygame.Surface, color: tuple, x: int, y: int, w: int, h: int,
+) -> None:
+    """Surface.fill a rect, clipping it at the top and left surface edges.
+
+    Surface.fill moves a rect with a negative origin onto the surface
+    instead of clipping it, so trim the rect here first.
+    """
+    if x < 0:
+        w += x
+        x = 0
+    if y < 0:
+        h += y
+        y = 0
+    if w > 0 and h > 0:
+        surface.fill(color, (x, y, w, h))
@@ -0,0 +1,30 @@
+"""Bresenham-style distribution of per-second rates across ticks.
+
+Damage (DPS), harvest rate and hive income are all specified per second
+but applied per tick. The integer split below hands out exactly ``rate``
+units over every TICK_RATE ticks, spread as evenly as possible — e.g. 5
+per second at 10 ticks/sec gives 1 on 5 of the 10 ticks.
+"""
+
+from __future__ import annotations
+
+from src.config import TICK_RATE
+
+# Per-tick amounts over one second for each rate, built on first use
+_TABLES: dict[int, tuple[int, ...]] = {}
+
+
+def make_table(rate: int) -> tuple[int, ...]:
+    """Amounts for each tick of a second; they sum to exactly ``rate``."""
+    return tuple(
+        (rate * (t + 1)) // TICK_RATE - (rate * t) // TICK_RATE
+        for t in range(TICK_RATE)
+    )
+
+
+def per_tick(rate: int, tick: int) -> int:
+    """Amount of a per-second ``rate`` applied on ``tick``."""
+    table = _TABLES.get(rate)
+    if table is None:
+        table = _TABLES[rate] = make_table(rate)
+    return table[tick % TICK_RATE]
@@ -15,16 +15,25 @@ from src.config import (
     MANTIS_JELLY,
     MILLI_TILES_PER_TILE,
     SPITTER_CORPSE_JELLY,
-    TICK_RATE,
 )
+from src.simulation.bresenham import per_tick as _damage_this_tick
+from src.simulation.spatial import SpatialGrid
 from src.simulation.state import EntityState, EntityType, GameState
 
-# Entity types that can be attacked
-_ATTACKABLE_TYPES = frozenset({
+# Entity types that can be attacked, as a bitmask over EntityType values
+# (tested with (1 << entity_type) & mask instead of a set lookup)
+_ATTACKABLE_MASK = 0
+for _t in (
     EntityType.ANT, EntityType.QUEEN, EntityType.HIVE,
     EntityType.APHID, EntityType.BEETLE, EntityType.MANTIS,
     EntityType.SPITTER,
-})
+):
+    _ATTACKABLE_MASK |= 1 << _t
+del _t
+
+# Cell size of the target grid: attack ranges are 1-4 tiles, so a query
+# covers 2x2 to 5x5 cells
+_ATTACK_CELL_MT = 2 * MILLI_TILES_PER_TILE
 
 # Jelly value dropped as corpse on death (types not listed leave no corpse)
 _CORPSE_JELLY = {
@@ -39,34 +48,46 @@ _CORPSE_JELLY = {
 def process_combat(state: GameState) -> None:
     """Run all combat logic for one tick.
 
-    Order: decay corpses -> auto-attack -> process deaths.
-    Decay runs first so newly created corpses aren't decayed on their first tick.
+    Order: auto-attack -> corpse decay and deaths (one pass).
+    Corpses created by deaths are appended after that pass, so they
+    aren't decayed on their first tick.
     """
-    _decay_corpses(state)
     _auto_attack(state)
-    _process_deaths(state)
+    _finalize_combat(state)
 
 
-def _damage_this_tick(dps: int, tick: int) -> int:
-    """Distribute DPS across ticks using Bresenham-style integer math.
+def _nearest_enemy(
+    grid: SpatialGrid[tuple[int, int, int, int]],
+    x: int, y: int, player_id: int, range_mt: int,
+) -> int:
+    """Find the nearest enemy record within range of (x, y).
 
-    Guarantees exactly ``dps`` total damage over every TICK_RATE ticks.
-    For example, 5 DPS at 10 ticks/sec deals 1 damage on 5 of the 10 ticks.
+    Works on the projected (x, y, player_id, entity_id) target records
+    only. Every record is a different owner's enemy: players fight
+    everyone else, and wildlife (-1) fights players but not wildlife.
+    Ties on distance go to the lowest entity_id. Returns the target's
+    entity_id, or -1 if no enemy is in range.
     """
-    t = tick % TICK_RATE
-    return (dps * (t + 1)) // TICK_RATE - (dps * t) // TICK_RATE
+    range_sq = range_mt * range_mt
+    best_target_id = -1
+    best_dist_sq = range_sq + 1
 
+    for bucket in grid.buckets(x, y, range_mt):
+        for tx, ty, target_pid, target_id in bucket:
+            if target_pid == player_id:
+                continue
+            dx = x - tx
+            dy = y - ty
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > range_sq:
+                continue
+            if dist_sq < best_dist_sq or (
+                dist_sq == best_dist_sq and target_id < best_target_id
+            ):
+                best_dist_sq = dist_sq
+                best_target_id = target_id
 
-def _is_enemy(attacker, target) -> bool:
-    """Check if target is a valid attack target for attacker."""
-    if target.entity_type not in _ATTACKABLE_TYPES:
-        return False
-    if target.player_id == attacker.player_id:
-        return False
-    # Wildlife doesn't attack other wildlife
-    if attacker.player_id == -1 and target.player_id == -1:
-        return False
-    return True
+    return best_target_id
 
 
 def _auto_attack(state: GameState) -> None:
@@ -75,68 +96,83 @@ def _auto_attack(state: GameState) -> None:
     Two-phase: compute all attacks from snapshot, then apply damage.
     This ensures combat is order-independent and deterministic.
     """
-    attacks: list[tuple[int, int]] = []  # (target_entity_id, damage)
+    damage_taken: dict[int, int] = {}  # target_entity_id -> total damage
 
+    # Project the hot fields of every potential target into flat records
+    # once, bucketed so each attacker only checks its neighbourhood
+    grid: SpatialGrid[tuple[int, int, int, int]] = SpatialGrid(_ATTACK_CELL_MT)
+    for e in state.entities:
+        if (1 << e.entity_type) & _ATTACKABLE_MASK:
+            grid.insert(e.x, e.y, (e.x, e.y, e.player_id, e.entity_id))
+
+    tick = state.tick
+    attacking = EntityState.ATTACKING
     for attacker in state.entities:
-        if attacker.damage <= 0:
+        damage = attacker.damage
+        if damage <= 0:
             continue
 
-        dmg = _damage_this_tick(attacker.damage, state.tick)
+        dmg = _damage_this_tick(damage, tick)
         if dmg <= 0:
             # Rest tick — don't change state to avoid visual flickering
             continue
 
         # Per-entity attack range (melee=1 tile, spitter=4 tiles)
         range_mt = attacker.attack_range * MILLI_TILES_PER_TILE
-        range_sq = range_mt * range_mt
-
-        # Find nearest enemy within attack range
-        best_target = None
-        best_dist_sq = range_sq + 1
-
-        for target in state.entities:
-            if not _is_enemy(attacker, target):
-                continue
-            dx = attacker.x - target.x
-            dy = attacker.y - target.y
-            dist_sq = dx * dx + dy * dy
-            if dist_sq > range_sq:
-                continue
-            if dist_sq < best_dist_sq or (
-                dist_sq == best_dist_sq
-                and (best_target is None or target.entity_id < best_target.entity_id)
-            ):
-                best_dist_sq = dist_sq
-                best_target = target
 
-        if best_target is not None:
-            attacks.append((best_target.entity_id, dmg))
-            attacker.state = EntityState.ATTACKING
-        elif attacker.state == EntityState.ATTACKING:
+        best_target_id = _nearest_enemy(
+            grid, attacker.x, attacker.y, attacker.player_id, range_mt,
+        )
+        if best_target_id >= 0:
+            damage_taken[best_target_id] = damage_taken.get(best_target_id, 0) + dmg
+            attacker.state = attacking
+        elif attacker.state == attacking:
             attacker.state = EntityState.IDLE
 
     # Apply all damage (snapshot-based, order-independent)
-    for target_id, dmg in attacks:
-        target = state.get_entity(target_id)
-        if target is not None:
-            target.hp -= dmg
+    by_id = state.entities_by_id
+    for target_id, total in damage_taken.items():
+        by_id[target_id].hp -= total
+
 
+def _finalize_combat(state: GameState) -> None:
+    """Decay corpses, remove expired corpses and dead entities, drop corpses.
 
-def _process_deaths(state: GameState) -> None:
-    """Remove dead entities and create corpses for those that drop jelly."""
+    Corpses lose 1 hp per tick and are removed at 0. Other dead entities
+    (except hive sites) are removed and leave a corpse if they drop jelly.
+    Survivors are compacted in place in a single pass over the entities,
+    which also rebuilds the corpse and mobile-entity lists.
+    """
+    entities = state.entities
+    by_id = state.entities_by_id
     dead = []
-    alive = []
-    for entity in state.entities:
-        if entity.hp <= 0 and entity.entity_type not in (
-            EntityType.CORPSE, EntityType.HIVE_SITE,
-        ):
+    corpses = []
+    mobile = []
+    w = 0
+    for entity in entities:
+        if entity.entity_type == EntityType.CORPSE:
+            entity.hp -= 1
+            if entity.hp <= 0:
+                by_id.pop(entity.entity_id, None)
+                continue
+            corpses.append(entity)
+        elif entity.hp <= 0 and entity.entity_type != EntityType.HIVE_SITE:
+            by_id.pop(entity.entity_id, None)
             dead.append(entity)
-        else:
-            alive.append(entity)
-
-    state.entities = alive
+            continue
+        if entity.speed != 0:
+            mobile.append(entity)
+        entities[w] = entity
+        w += 1
+    del entities[w:]
+    state.corpses = corpses
+    state.mobile_entities = mobile
 
     for entity in dead:
+        if entity.entity_type == EntityType.HIVE:
+            state.hives_by_player[entity.player_id].remove(entity)
+        elif entity.entity_type == EntityType.QUEEN:
+            state.queens.remove(entity)
         jelly = _CORPSE_JELLY.get(entity.entity_type, 0)
         if jelly > 0:
             state.create_entity(
@@ -150,15 +186,3 @@ def _process_deaths(state: GameState) -> None:
                 speed=0,
                 damage=0,
             )
-
-
-def _decay_corpses(state: GameState) -> None:
-    """Decrement corpse hp each tick and remove expired corpses."""
-    for entity in state.entities:
-        if entity.entity_type == EntityType.CORPSE:
-            entity.hp -= 1
-
-    state.entities = [
-        e for e in state.entities
-        if not (e.entity_type == EntityType.CORPSE and e.hp <= 0)
-    ]
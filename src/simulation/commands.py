@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import IntEnum
+from operator import attrgetter
 
 
 class CommandType(IntEnum):
@@ -53,6 +54,12 @@ class Command:
         return (self.player_id, self.command_type, self.tick)
 
 
+# Same key as Command.sort_key, as a C-level callable for list.sort(). Only
+# these fields take part: the sort is stable, so commands that tie keep
+# their arrival order (e.g. two MOVEs on one tick, the later one wins)
+COMMAND_ORDER = attrgetter("player_id", "command_type", "tick")
+
+
 class CommandQueue:
     """Collects commands from both players, keyed by tick.
 
@@ -63,38 +70,31 @@ class CommandQueue:
     """
 
     def __init__(self) -> None:
-        self._commands: dict[int, list[Command]] = {}
+        # Commands per tick; a dict used as an insertion-ordered set so
+        # duplicates are dropped with a hash lookup
+        self._commands: dict[int, dict[Command, None]] = {}
+        # Players heard from (a command or an empty marker), keyed by tick
+        self._ready: dict[int, set[int]] = {}
 
     def add(self, command: Command) -> None:
         """Add a command to the queue."""
-        tick_cmds = self._commands.setdefault(command.tick, [])
         # Deduplicate (network may send the same command multiple times)
-        if command not in tick_cmds:
-            tick_cmds.append(command)
+        self._commands.setdefault(command.tick, {})[command] = None
+        self._ready.setdefault(command.tick, set()).add(command.player_id)
 
     def has_tick(self, tick: int, player_id: int) -> bool:
         """Check if we have received ANY command (or empty marker) for a
         player on a given tick. Used by lockstep to know if the peer is ready."""
-        # We store an empty list as a marker when a player sends no commands
-        if tick not in self._commands:
-            return False
-        return any(c.player_id == player_id for c in self._commands[tick])
+        ready = self._ready.get(tick)
+        return ready is not None and player_id in ready
 
     def mark_empty(self, tick: int, player_id: int) -> None:
-        """Mark that a player explicitly sent no commands for this tick.
-
-        We insert a sentinel so has_tick() returns True.
-        """
-        sentinel = Command(
-            command_type=CommandType.STOP,
-            player_id=player_id,
-            tick=tick,
-            entity_ids=(),
-        )
-        self.add(sentinel)
+        """Mark that a player explicitly sent no commands for this tick."""
+        self._ready.setdefault(tick, set()).add(player_id)
 
     def pop_tick(self, tick: int) -> list[Command]:
         """Remove and return all commands for a tick, sorted deterministically."""
-        cmds = self._commands.pop(tick, [])
-        cmds.sort(key=lambda c: c.sort_key())
+        self._ready.pop(tick, None)
+        cmds = list(self._commands.pop(tick, ()))
+        cmds.sort(key=COMMAND_ORDER)
         return cmds
@@ -17,26 +17,22 @@ from src.config import (
     HARVEST_RANGE,
     HARVEST_RATE,
     MILLI_TILES_PER_TILE,
-    TICK_RATE,
 )
-from src.simulation.pathfinding import find_path
-from src.simulation.state import EntityState, EntityType, GameState
+from src.simulation.bresenham import per_tick as _harvest_this_tick
+from src.simulation.state import Entity, EntityState, EntityType, GameState
 
 _HARVEST_RANGE_MT = HARVEST_RANGE * MILLI_TILES_PER_TILE
 _HARVEST_RANGE_SQ = _HARVEST_RANGE_MT * _HARVEST_RANGE_MT
 
 
-def _harvest_this_tick(rate: int, tick: int) -> int:
-    """Bresenham-style integer distribution of harvest rate across ticks."""
-    t = tick % TICK_RATE
-    return (rate * (t + 1)) // TICK_RATE - (rate * t) // TICK_RATE
-
-
 def process_harvesting(state: GameState) -> None:
     """Process all harvesting ants for one tick.
 
     Called after movement — ants that just arrived can extract or deposit.
     """
+    # Ants heading home only compare distances to their own few hives
+    hives_by_player = state.hives_by_player
+
     for entity in state.entities:
         if entity.state != EntityState.HARVESTING:
             continue
@@ -58,34 +54,29 @@ def process_harvesting(state: GameState) -> None:
             dx = entity.x - corpse.x
             dy = entity.y - corpse.y
             if dx * dx + dy * dy <= _HARVEST_RANGE_SQ:
-                _try_extract(state, entity)
+                _try_extract(
+                    state, entity, corpse,
+                    hives_by_player.get(entity.player_id, []),
+                )
             else:
                 # Pushed out of range by separation — return to corpse
                 _pathfind_to(state, entity, corpse.x, corpse.y)
         elif entity.carrying > 0:
             # Full or corpse empty/gone — deposit at hive
-            _try_deposit(state, entity)
+            _try_deposit(
+                state, entity, corpse if corpse_has_jelly else None,
+                hives_by_player.get(entity.player_id, []),
+            )
         else:
             # No jelly and no valid corpse — done
             entity.state = EntityState.IDLE
             entity.target_entity_id = -1
 
 
-def _try_extract(state: GameState, entity) -> None:
-    """Extract jelly from the targeted corpse."""
-    corpse = state.get_entity(entity.target_entity_id)
-    if corpse is None or corpse.entity_type != EntityType.CORPSE:
-        entity.state = EntityState.IDLE
-        entity.target_entity_id = -1
-        return
-
-    dx = entity.x - corpse.x
-    dy = entity.y - corpse.y
-    if dx * dx + dy * dy > _HARVEST_RANGE_SQ:
-        # Not close enough — pathfind to corpse
-        _pathfind_to(state, entity, corpse.x, corpse.y)
-        return
-
+def _try_extract(
+    state: GameState, entity, corpse: Entity, hives: list[Entity],
+) -> None:
+    """Extract jelly from the targeted corpse, already checked to be in range."""
     amount = _harvest_this_tick(HARVEST_RATE, state.tick)
     can_carry = ANT_CARRY_CAPACITY - entity.carrying
     available = corpse.jelly_value
@@ -96,17 +87,15 @@ def _try_extract(state: GameState, entity) -> None:
         corpse.jelly_value -= transfer
 
     if entity.carrying >= ANT_CARRY_CAPACITY or corpse.jelly_value <= 0:
-        _send_to_nearest_hive(state, entity)
+        _send_to_nearest_hive(state, entity, hives)
 
 
-def _try_deposit(state: GameState, entity) -> None:
-    """Deposit carried jelly at nearest own hive."""
+def _nearest_hive(entity, hives: list[Entity]) -> tuple[Entity | None, int]:
+    """Find the nearest of the entity's own hives and its squared distance."""
     nearest_hive = None
     best_dist_sq = 0
 
-    for e in state.entities:
-        if e.entity_type != EntityType.HIVE or e.player_id != entity.player_id:
-            continue
+    for e in hives:
         dx = entity.x - e.x
         dy = entity.y - e.y
         dist_sq = dx * dx + dy * dy
@@ -114,6 +103,18 @@ def _try_deposit(state: GameState, entity) -> None:
             nearest_hive = e
             best_dist_sq = dist_sq
 
+    return nearest_hive, best_dist_sq
+
+
+def _try_deposit(
+    state: GameState, entity, corpse: Entity | None, hives: list[Entity],
+) -> None:
+    """Deposit carried jelly at nearest own hive.
+
+    ``corpse`` is the ant's target if it still has jelly to go back for.
+    """
+    nearest_hive, best_dist_sq = _nearest_hive(entity, hives)
+
     if nearest_hive is None:
         entity.state = EntityState.IDLE
         entity.target_entity_id = -1
@@ -130,32 +131,16 @@ def _try_deposit(state: GameState, entity) -> None:
     entity.carrying = 0
 
     # Go back for more
-    corpse = state.get_entity(entity.target_entity_id)
-    if (
-        corpse is not None
-        and corpse.entity_type == EntityType.CORPSE
-        and corpse.jelly_value > 0
-    ):
+    if corpse is not None:
         _pathfind_to(state, entity, corpse.x, corpse.y)
     else:
         entity.state = EntityState.IDLE
         entity.target_entity_id = -1
 
 
-def _send_to_nearest_hive(state: GameState, entity) -> None:
+def _send_to_nearest_hive(state: GameState, entity, hives: list[Entity]) -> None:
     """Pathfind a carrying ant to its nearest own hive."""
-    nearest_hive = None
-    best_dist_sq = 0
-
-    for e in state.entities:
-        if e.entity_type != EntityType.HIVE or e.player_id != entity.player_id:
-            continue
-        dx = entity.x - e.x
-        dy = entity.y - e.y
-        dist_sq = dx * dx + dy * dy
-        if nearest_hive is None or dist_sq < best_dist_sq:
-            nearest_hive = e
-            best_dist_sq = dist_sq
+    nearest_hive, _ = _nearest_hive(entity, hives)
 
     if nearest_hive is None:
         entity.state = EntityState.IDLE
@@ -172,22 +157,20 @@ def _pathfind_to(state: GameState, entity, goal_x: int, goal_y: int) -> None:
     start_tile_x = entity.x // MILLI_TILES_PER_TILE
     start_tile_y = entity.y // MILLI_TILES_PER_TILE
 
-    tile_path = find_path(
+    # Harvesters repeat the same corpse <-> hive trips, so use the cache
+    milli_path = state.path_cache.find_milli_path(
         state.tilemap,
         start_tile_x, start_tile_y,
         target_tile_x, target_tile_y,
     )
 
-    if not tile_path:
+    if not milli_path:
         entity.target_x = goal_x
         entity.target_y = goal_y
         entity.path = []
+        entity.path_idx = 0
     else:
-        milli_path = [
-            (tx * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2,
-             ty * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2)
-            for tx, ty in tile_path
-        ]
         entity.path = milli_path
+        entity.path_idx = 0
         entity.target_x = milli_path[-1][0]
         entity.target_y = milli_path[-1][1]
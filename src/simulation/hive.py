@@ -32,10 +32,9 @@ from src.config import (
     SPITTER_MORPH_COST,
     SPITTER_SIGHT,
     SPITTER_SPEED,
-    TICK_RATE,
 )
+from src.simulation.bresenham import per_tick as _income_this_tick
 from src.simulation.commands import Command
-from src.simulation.pathfinding import find_path
 from src.simulation.state import EntityState, EntityType, GameState
 
 # Merge range in milli-tiles (squared for distance comparison)
@@ -61,21 +60,15 @@ def process_hive_mechanics(state: GameState) -> None:
 
 # -- Passive income ----------------------------------------------------------
 
-def _income_this_tick(income_per_sec: int, tick: int) -> int:
-    """Distribute per-second income across ticks using Bresenham integer math."""
-    t = tick % TICK_RATE
-    return (income_per_sec * (t + 1)) // TICK_RATE - (income_per_sec * t) // TICK_RATE
-
-
 def _apply_passive_income(state: GameState) -> None:
     """Each hive generates HIVE_PASSIVE_INCOME jelly per second for its owner."""
     income = _income_this_tick(HIVE_PASSIVE_INCOME, state.tick)
     if income <= 0:
         return
-    for entity in state.entities:
-        if entity.entity_type == EntityType.HIVE and entity.player_id >= 0:
-            state.player_jelly[entity.player_id] = (
-                state.player_jelly.get(entity.player_id, 0) + income
+    for player_id, hives in state.hives_by_player.items():
+        if hives and player_id >= 0:
+            state.player_jelly[player_id] = (
+                state.player_jelly.get(player_id, 0) + income * len(hives)
             )
 
 
@@ -91,6 +84,10 @@ _SPAWN_DIRS = [
     (-MILLI_TILES_PER_TILE, 0),                          # W
     (-MILLI_TILES_PER_TILE, -MILLI_TILES_PER_TILE),     # NW
 ]
+# The same directions as tile deltas, for walkability checks
+_SPAWN_TILE_DIRS = [
+    (dx // MILLI_TILES_PER_TILE, dy // MILLI_TILES_PER_TILE) for dx, dy in _SPAWN_DIRS
+]
 
 
 def _tick_spawn_cooldowns(state: GameState) -> None:
@@ -120,21 +117,52 @@ def _tick_spawn_cooldowns(state: GameState) -> None:
 
 def _pick_spawn_pos(state: GameState, hx: int, hy: int) -> tuple[int, int]:
     """Pick a walkable position adjacent to the hive for spawning."""
-    start = state.next_random(8)
-    for i in range(8):
-        dx, dy = _SPAWN_DIRS[(start + i) % 8]
-        nx, ny = hx + dx, hy + dy
-        tile_x = nx // MILLI_TILES_PER_TILE
-        tile_y = ny // MILLI_TILES_PER_TILE
-        if state.tilemap.is_walkable(tile_x, tile_y):
-            return nx, ny
-    return hx, hy
+    return _spawn_positions(state, hx, hy)[state.next_random(8)]
+
+
+def _spawn_positions(
+    state: GameState, hx: int, hy: int,
+) -> tuple[tuple[int, int], ...]:
+    """Spawn position for each of the 8 random start directions.
+
+    Entry i is the first walkable neighbour clockwise from _SPAWN_DIRS[i]
+    (or the hive itself if boxed in). Hives don't move, so the table is
+    cached per hive position until the tilemap changes.
+    """
+    tilemap = state.tilemap
+    cached = state.spawn_positions.get((hx, hy))
+    if cached is not None and cached[0] is tilemap and cached[1] == tilemap.version:
+        return cached[2]
+
+    neighbours = [(hx + dx, hy + dy) for dx, dy in _SPAWN_DIRS]
+    htx = hx // MILLI_TILES_PER_TILE
+    hty = hy // MILLI_TILES_PER_TILE
+    walkable = [
+        tilemap.is_walkable(htx + tdx, hty + tdy) for tdx, tdy in _SPAWN_TILE_DIRS
+    ]
+    table = []
+    for start in range(8):
+        pos = (hx, hy)
+        for i in range(8):
+            d = (start + i) % 8
+            if walkable[d]:
+                pos = neighbours[d]
+                break
+        table.append(pos)
+    positions = tuple(table)
+    state.spawn_positions[(hx, hy)] = (tilemap, tilemap.version, positions)
+    return positions
 
 
 # -- Founding ------------------------------------------------------------------
 
 def _check_founding(state: GameState) -> None:
     """Check if any FOUNDING queen has arrived at a hive site."""
+    # Queens are rare, so most ticks stop here without touching entities
+    founding = [q for q in state.queens if q.state == EntityState.FOUNDING]
+    if not founding:
+        return
+
     hive_sites = [
         e for e in state.entities if e.entity_type == EntityType.HIVE_SITE
     ]
@@ -144,12 +172,7 @@ def _check_founding(state: GameState) -> None:
     queens_to_remove: list[int] = []
     sites_to_convert: list[tuple[int, int, int, int]] = []  # (site_id, player_id, x, y)
 
-    for queen in state.entities:
-        if queen.entity_type != EntityType.QUEEN:
-            continue
-        if queen.state != EntityState.FOUNDING:
-            continue
-
+    for queen in founding:
         for site in hive_sites:
             dx = queen.x - site.x
             dy = queen.y - site.y
@@ -164,11 +187,8 @@ def _check_founding(state: GameState) -> None:
         return
 
     remove_ids = set(queens_to_remove)
-    remove_site_ids = {s[0] for s in sites_to_convert}
-    state.entities = [
-        e for e in state.entities
-        if e.entity_id not in remove_ids and e.entity_id not in remove_site_ids
-    ]
+    remove_ids.update(s[0] for s in sites_to_convert)
+    state.remove_entities(remove_ids)
 
     for _site_id, player_id, sx, sy in sites_to_convert:
         state.create_entity(
@@ -191,25 +211,17 @@ def _check_win_condition(state: GameState) -> None:
     if state.game_over:
         return
 
-    player_hives: dict[int, int] = {}
-    for entity in state.entities:
-        if entity.entity_type == EntityType.HIVE and entity.player_id >= 0:
-            player_hives[entity.player_id] = (
-                player_hives.get(entity.player_id, 0) + 1
-            )
-
-    eliminated = []
-    alive = []
-    for player_id in sorted(state.player_jelly):
-        if player_hives.get(player_id, 0) == 0:
-            eliminated.append(player_id)
-        else:
-            alive.append(player_id)
+    # Hive lists are kept current by create_entity and the death pass,
+    # so this is a per-player check rather than an entity scan
+    hives_by_player = state.hives_by_player
+    alive = [pid for pid in sorted(state.player_jelly) if hives_by_player.get(pid)]
+    if len(alive) == len(state.player_jelly):
+        return
 
-    if eliminated and len(alive) == 1:
+    if len(alive) == 1:
         state.game_over = True
         state.winner = alive[0]
-    elif eliminated and len(alive) == 0:
+    elif not alive:
         state.game_over = True
         state.winner = -1
 
@@ -263,8 +275,7 @@ def handle_merge_queen(state: GameState, cmd: Command) -> None:
         return
 
     ants_to_merge = valid_ants[:QUEEN_MERGE_COST]
-    merged_ids = {a.entity_id for a in ants_to_merge}
-    state.entities = [e for e in state.entities if e.entity_id not in merged_ids]
+    state.remove_entities({a.entity_id for a in ants_to_merge})
 
     state.create_entity(
         player_id=cmd.player_id,
@@ -303,20 +314,17 @@ def handle_found_hive(state: GameState, cmd: Command) -> None:
     target_tx = site.x // MILLI_TILES_PER_TILE
     target_ty = site.y // MILLI_TILES_PER_TILE
 
-    tile_path = find_path(state.tilemap, start_tx, start_ty, target_tx, target_ty)
-    if tile_path:
-        milli_path = [
-            (tx * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2,
-             ty * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2)
-            for tx, ty in tile_path
-        ]
+    milli_path = state.path_cache.find_milli_path(state.tilemap, start_tx, start_ty, target_tx, target_ty)
+    if milli_path:
         queen.path = milli_path
+        queen.path_idx = 0
         queen.target_x = milli_path[-1][0]
         queen.target_y = milli_path[-1][1]
     else:
         queen.target_x = site.x
         queen.target_y = site.y
         queen.path = []
+        queen.path_idx = 0
 
     queen.state = EntityState.FOUNDING
 
@@ -357,7 +365,7 @@ def handle_morph_spitter(state: GameState, cmd: Command) -> None:
 
     # Remove the ant, create spitter at the ant's position
     sx, sy = ant.x, ant.y
-    state.entities = [e for e in state.entities if e.entity_id != ant.entity_id]
+    state.remove_entities({ant.entity_id})
 
     state.create_entity(
         player_id=cmd.player_id,
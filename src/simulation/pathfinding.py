@@ -10,8 +10,13 @@ both peers always compute the same path for the same inputs.
 from __future__ import annotations
 
 import heapq
+from collections import OrderedDict
 
-from src.simulation.tilemap import TileMap
+from src.config import MILLI_TILES_PER_TILE
+from src.simulation.tilemap import TileMap, TileType
+
+# Offset from a tile's corner to its center, in milli-tiles
+_HALF_TILE_MT = MILLI_TILES_PER_TILE // 2
 
 # Movement costs (integer, scaled by 1000 to avoid floats)
 CARDINAL_COST = 1000
@@ -30,6 +35,36 @@ _NEIGHBORS = [
 ]
 
 
+class _SearchNodes:
+    """Per-node A* arrays, reused by every search on a map of one size.
+
+    Allocating the flat arrays afresh made each search O(width * height)
+    before its first step, which dominated short queries. Instead every
+    search takes a new generation number: a node's g-cost, parent and
+    heuristic are only valid while ``opened[node]`` holds the current
+    generation, and it has been expanded while ``closed[node]`` does, so
+    nothing needs clearing between searches.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.generation = 0
+        self.g_costs = [0] * size
+        self.came_from = [0] * size
+        self.h_costs = [0] * size
+        self.opened = [0] * size
+        self.closed = [0] * size
+
+    def next_generation(self) -> int:
+        """Start a search; stamps from earlier searches become stale."""
+        self.generation += 1
+        return self.generation
+
+
+# Arrays for the most recent map size (deterministic sims run one map)
+_search_nodes = _SearchNodes(0)
+
+
 def _heuristic(x: int, y: int, gx: int, gy: int) -> int:
     """Chebyshev-style heuristic scaled to match movement costs.
 
@@ -71,47 +106,175 @@ def find_path(
     if not tilemap.is_walkable(goal_x, goal_y):
         return []
 
-    # open set: (f_cost, y, x, g_cost) — y before x for deterministic tie-breaking
+    # Per-node state in flat arrays indexed by y * width + x rather than
+    # dicts keyed by (x, y) tuples, shared across searches (see _SearchNodes)
+    global _search_nodes
+    width = tilemap.width
+    height = tilemap.height
+    size = width * height
+    nodes = _search_nodes
+    if nodes.size != size:
+        nodes = _search_nodes = _SearchNodes(size)
+    gen = nodes.next_generation()
+    g_costs = nodes.g_costs
+    came_from = nodes.came_from
+    h_costs = nodes.h_costs  # heuristic, computed once per node
+    opened = nodes.opened  # == gen once a node has a g-cost this search
+    closed = nodes.closed  # == gen once a node has been expanded
+    start = start_y * width + start_x
+    goal = goal_y * width + goal_x
+    g_costs[start] = 0
+    opened[start] = gen
+
+    # Neighbour offsets with their flat-index delta for this map width
+    steps = [(dx, dy, dy * width + dx, cost) for dx, dy, cost in _NEIGHBORS]
+    # Walkability is read straight from the flat tile list (same layout)
+    # instead of calling is_walkable up to three times per neighbour
+    tiles = tilemap.tiles
+    dirt = int(TileType.DIRT)
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    cardinal = CARDINAL_COST
+    diagonal = DIAGONAL_COST
+
+    # open set: (f_cost, y * width + x) — the packed index orders ties by
+    # y, then x, for deterministic tie-breaking with two-int comparisons.
+    # A node's g is read from g_costs: the heuristic is consistent, so the
+    # first pop of a node is its best route and later entries are stale
     start_h = _heuristic(start_x, start_y, goal_x, goal_y)
-    open_set: list[tuple[int, int, int, int]] = [(start_h, start_y, start_x, 0)]
-    came_from: dict[tuple[int, int], tuple[int, int]] = {}
-    g_costs: dict[tuple[int, int], int] = {(start_x, start_y): 0}
+    open_set: list[tuple[int, int]] = [(start_h, start)]
 
     while open_set:
-        _f, _y, _x, g = heapq.heappop(open_set)
+        _f, node = heappop(open_set)
 
-        if _x == goal_x and _y == goal_y:
+        if node == goal:
             # Reconstruct path (start excluded, goal included)
             path: list[tuple[int, int]] = []
-            cx, cy = goal_x, goal_y
-            while (cx, cy) != (start_x, start_y):
+            while node != start:
+                cy, cx = divmod(node, width)
                 path.append((cx, cy))
-                cx, cy = came_from[(cx, cy)]
+                node = came_from[node]
             path.reverse()
             return path
 
-        # Skip if we already found a better route to this node
-        if g > g_costs.get((_x, _y), g + 1):
+        # Skip stale entries for nodes already expanded
+        if closed[node] == gen:
             continue
+        closed[node] = gen
+        g = g_costs[node]
+        _y, _x = divmod(node, width)
 
-        for dx, dy, cost in _NEIGHBORS:
+        for dx, dy, delta, cost in steps:
             nx, ny = _x + dx, _y + dy
-
-            if not tilemap.is_walkable(nx, ny):
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            neighbor = node + delta
+            if closed[neighbor] == gen or tiles[neighbor] != dirt:
                 continue
 
             # For diagonal moves, check that both cardinal neighbors are walkable
-            # to prevent cutting through diagonal rock corners
+            # to prevent cutting through diagonal rock corners (both lie in
+            # bounds because the current node and the neighbour do)
             if dx != 0 and dy != 0:
-                if not tilemap.is_walkable(_x + dx, _y) or not tilemap.is_walkable(_x, _y + dy):
+                if tiles[node + dx] != dirt or tiles[node + dy * width] != dirt:
                     continue
 
             new_g = g + cost
-            if new_g < g_costs.get((nx, ny), new_g + 1):
-                g_costs[(nx, ny)] = new_g
-                h = _heuristic(nx, ny, goal_x, goal_y)
-                f = new_g + h
-                came_from[(nx, ny)] = (_x, _y)
-                heapq.heappush(open_set, (f, ny, nx, new_g))
+            if opened[neighbor] == gen:
+                if new_g >= g_costs[neighbor]:
+                    continue
+                h = h_costs[neighbor]
+            else:
+                opened[neighbor] = gen
+                # _heuristic inlined: this runs once per reached node
+                hx = nx - goal_x
+                if hx < 0:
+                    hx = -hx
+                hy = ny - goal_y
+                if hy < 0:
+                    hy = -hy
+                if hx > hy:
+                    h = hy * diagonal + (hx - hy) * cardinal
+                else:
+                    h = hx * diagonal + (hy - hx) * cardinal
+                h_costs[neighbor] = h
+            g_costs[neighbor] = new_g
+            came_from[neighbor] = node
+            heappush(open_set, (new_g + h, neighbor))
 
     return []  # no path found
+
+
+class PathCache:
+    """Memo of find_path results keyed by start and goal tile.
+
+    Many units travel between the same few endpoints (e.g. a squad
+    ordered to the same spot, or harvesters shuttling between a corpse and
+    a hive), so repeated searches are served from the cache. Paths are a
+    pure function of the terrain and the endpoints, so a hit returns
+    exactly what find_path would; the cache is dropped whenever the
+    tilemap (or its version) changes. Beyond ``max_entries`` the least
+    recently used path is evicted.
+
+    Paths are returned as immutable tuples, and the milli-tile form is
+    kept alongside the tile path. Every unit sent between the same two
+    tiles therefore holds one shared tuple instead of its own copy.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._tilemap: TileMap | None = None
+        self._version = -1
+        self._paths: OrderedDict[tuple[int, int, int, int], tuple[tuple[int, int], ...]] = OrderedDict()
+        self._milli_paths: dict[tuple[int, int, int, int], tuple[tuple[int, int], ...]] = {}
+
+    def find_path(
+        self,
+        tilemap: TileMap,
+        start_x: int,
+        start_y: int,
+        goal_x: int,
+        goal_y: int,
+    ) -> tuple[tuple[int, int], ...]:
+        """Cached find_path(); returns the waypoints as an immutable tuple."""
+        if tilemap is not self._tilemap or tilemap.version != self._version:
+            self._tilemap = tilemap
+            self._version = tilemap.version
+            self._paths.clear()
+            self._milli_paths.clear()
+
+        key = (start_x, start_y, goal_x, goal_y)
+        paths = self._paths
+        path = paths.get(key)
+        if path is None:
+            path = tuple(find_path(tilemap, start_x, start_y, goal_x, goal_y))
+            paths[key] = path
+            if len(paths) > self.max_entries:
+                evicted, _ = paths.popitem(last=False)
+                self._milli_paths.pop(evicted, None)
+        else:
+            paths.move_to_end(key)
+        return path
+
+    def find_milli_path(
+        self,
+        tilemap: TileMap,
+        start_x: int,
+        start_y: int,
+        goal_x: int,
+        goal_y: int,
+    ) -> tuple[tuple[int, int], ...]:
+        """Cached path as milli-tile waypoints (tile centers).
+
+        Takes tile coordinates like find_path(); empty if there is no path.
+        The tuple is shared by every caller asking for the same endpoints.
+        """
+        path = self.find_path(tilemap, start_x, start_y, goal_x, goal_y)
+        key = (start_x, start_y, goal_x, goal_y)
+        milli_path = self._milli_paths.get(key)
+        if milli_path is None:
+            tile_mt = MILLI_TILES_PER_TILE
+            half = _HALF_TILE_MT
+            milli_path = tuple([(tx * tile_mt + half, ty * tile_mt + half) for tx, ty in path])
+            self._milli_paths[key] = milli_path
+        return milli_path
@@ -0,0 +1,69 @@
+"""Uniform spatial hash grid for neighbourhood queries.
+
+Items are bucketed by the square cell containing their position. A query
+returns every item in the cells overlapping a square around a point — a
+superset of those within the radius, so callers still apply their own
+exact distance test and tie-breaking.
+
+Items can be entities or flat records of their hot fields (e.g. position,
+owner and id tuples), which keeps attribute lookups out of inner loops.
+
+DETERMINISM: Buckets keep insertion order and queries walk cells in
+row-major order, so results depend only on the simulation state.
+"""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SpatialGrid(Generic[T]):
+    """Items bucketed into square cells of ``cell_size`` milli-tiles."""
+
+    def __init__(self, cell_size: int) -> None:
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[T]] = {}
+
+    def insert(self, x: int, y: int, item: T) -> None:
+        """Add an item at position (x, y)."""
+        size = self.cell_size
+        cell = (x // size, y // size)
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            self._cells[cell] = [item]
+        else:
+            bucket.append(item)
+
+    def buckets(self, x: int, y: int, radius: int) -> list[list[T]]:
+        """Get the cell buckets overlapping the square x/y ± radius.
+
+        Same items as query() without copying them into one list; for
+        hot loops that only iterate. The buckets must not be modified.
+        """
+        size = self.cell_size
+        cells = self._cells
+        cx0 = (x - radius) // size
+        cx1 = (x + radius) // size
+        result: list[list[T]] = []
+        for cy in range((y - radius) // size, (y + radius) // size + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    result.append(bucket)
+        return result
+
+    def query(self, x: int, y: int, radius: int) -> list[T]:
+        """Get the items in all cells overlapping the square x/y ± radius."""
+        size = self.cell_size
+        cells = self._cells
+        cx0 = (x - radius) // size
+        cx1 = (x + radius) // size
+        result: list[T] = []
+        for cy in range((y - radius) // size, (y + radius) // size + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    result.extend(bucket)
+        return result
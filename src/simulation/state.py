@@ -14,6 +14,8 @@ DETERMINISM RULES:
 from __future__ import annotations
 
 import hashlib
+import struct
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import IntEnum
 
@@ -26,6 +28,7 @@ from src.config import (
     MAP_WIDTH_TILES,
     STARTING_JELLY,
 )
+from src.simulation.pathfinding import PathCache
 from src.simulation.tilemap import TileMap, generate_map
 from src.simulation.visibility import VisibilityMap
 
@@ -50,6 +53,11 @@ class EntityState(IntEnum):
     FOUNDING = 4    # queen building a hive
 
 
+# Hashed entity fields, big-endian: 1-byte enums, 4-byte ints (signed
+# where the field can be negative). Byte-for-byte the layout peers compare.
+_ENTITY_STRUCT = struct.Struct(">IBiiiiiIIIIBIIIIiI")
+
+
 @dataclass(slots=True)
 class Entity:
     """A game entity (ant, queen, hive, wildlife, corpse, etc.).
@@ -68,7 +76,9 @@ class Entity:
     max_hp: int = ANT_HP
     damage: int = 0         # DPS (converted to per-tick in simulation)
     state: EntityState = EntityState.IDLE
-    path: list[tuple[int, int]] = field(default_factory=list)
+    path: Sequence[tuple[int, int]] = field(default_factory=list)  # may be shared; never mutated
+    path_idx: int = 0       # next waypoint in path (path is cleared on arrival)
+    path_step: tuple[int, ...] = ()  # cached step toward the waypoint (see tick._follow_path)
     carrying: int = 0       # jelly being carried
     jelly_value: int = 0    # jelly dropped on death (corpse value)
     sight: int = ANT_SIGHT  # sight radius in tiles
@@ -91,6 +101,24 @@ class GameState:
         next_entity_id: Counter for assigning entity IDs.
         game_over: Whether the game has ended.
         winner: Player ID of the winner, or -1.
+        entities_by_id: Every entity keyed by entity_id, for get_entity.
+            Derived from entities (not hashed); kept current by
+            create_entity, remove_entities and the combat death pass, the
+            only places entities appear or vanish.
+        hives_by_player: Each player's hives, ordered by entity_id. Derived
+            and maintained like entities_by_id.
+        queens: All queens, ordered by entity_id. Derived like
+            entities_by_id.
+        corpses: All corpses, ordered by entity_id. Derived like
+            entities_by_id; the death pass also drops decayed corpses.
+        mobile_entities: Entities with nonzero speed (speed is fixed at
+            creation), ordered by entity_id. Derived like corpses; the
+            movement and separation passes walk only these.
+        path_cache: LRU memo of A* results; every simulation system
+            pathfinds through it. Derived from the tilemap (not hashed).
+        spawn_positions: Per hive position, the tilemap and version it was
+            computed for and the ant spawn point for each random start
+            direction (see hive._spawn_positions). Not hashed.
     """
 
     def __init__(self, seed: int = 0, tilemap: TileMap | None = None) -> None:
@@ -100,6 +128,15 @@ class GameState:
         self.next_entity_id: int = 0
         self.game_over: bool = False
         self.winner: int = -1
+        self.entities_by_id: dict[int, Entity] = {}
+        self.hives_by_player: dict[int, list[Entity]] = {}
+        self.queens: list[Entity] = []
+        self.corpses: list[Entity] = []
+        self.mobile_entities: list[Entity] = []
+        self.path_cache = PathCache()
+        self.spawn_positions: dict[
+            tuple[int, int], tuple[TileMap, int, tuple[tuple[int, int], ...]]
+        ] = {}
         if tilemap is not None:
             self.tilemap = tilemap
             self.player_jelly: dict[int, int] = {0: 0, 1: 0}
@@ -131,14 +168,44 @@ class GameState:
         )
         self.next_entity_id += 1
         self.entities.append(entity)
+        self.entities_by_id[entity.entity_id] = entity
+        if entity_type == EntityType.HIVE:
+            self.hives_by_player.setdefault(player_id, []).append(entity)
+        elif entity_type == EntityType.QUEEN:
+            self.queens.append(entity)
+        elif entity_type == EntityType.CORPSE:
+            self.corpses.append(entity)
+        if entity.speed != 0:
+            self.mobile_entities.append(entity)
         return entity
 
+    def remove_entities(self, entity_ids: set[int]) -> None:
+        """Remove entities by ID, compacting the entity list in place.
+
+        Keeps entity order and updates the derived indexes.
+        """
+        entities = self.entities
+        by_id = self.entities_by_id
+        w = 0
+        for entity in entities:
+            if entity.entity_id not in entity_ids:
+                entities[w] = entity
+                w += 1
+                continue
+            by_id.pop(entity.entity_id, None)
+            if entity.entity_type == EntityType.HIVE:
+                self.hives_by_player[entity.player_id].remove(entity)
+            elif entity.entity_type == EntityType.QUEEN:
+                self.queens.remove(entity)
+            elif entity.entity_type == EntityType.CORPSE:
+                self.corpses.remove(entity)
+            if entity.speed != 0:
+                self.mobile_entities.remove(entity)
+        del entities[w:]
+
     def get_entity(self, entity_id: int) -> Entity | None:
         """Look up an entity by ID. Returns None if not found."""
-        for entity in self.entities:
-            if entity.entity_id == entity_id:
-                return entity
-        return None
+        return self.entities_by_id.get(entity_id)
 
     def next_random(self, bound: int) -> int:
         """Deterministic PRNG (LCG). Returns a value in [0, bound).
@@ -163,28 +230,24 @@ class GameState:
             h.update(pid.to_bytes(4, "big", signed=True))
             h.update(self.player_jelly[pid].to_bytes(4, "big"))
         # Tilemap tiles
-        h.update(bytes(self.tilemap.tiles))
+        h.update(self.tilemap.tile_bytes())
         # Entities
         h.update(len(self.entities).to_bytes(4, "big"))
+        pack_into = _ENTITY_STRUCT.pack_into
+        size = _ENTITY_STRUCT.size
+        buf = bytearray(size * len(self.entities))
+        offset = 0
         for e in self.entities:
-            h.update(e.entity_id.to_bytes(4, "big"))
-            h.update(e.entity_type.to_bytes(1, "big"))
-            h.update(e.player_id.to_bytes(4, "big", signed=True))
-            h.update(e.x.to_bytes(4, "big", signed=True))
-            h.update(e.y.to_bytes(4, "big", signed=True))
-            h.update(e.target_x.to_bytes(4, "big", signed=True))
-            h.update(e.target_y.to_bytes(4, "big", signed=True))
-            h.update(e.speed.to_bytes(4, "big"))
-            h.update(e.hp.to_bytes(4, "big"))
-            h.update(e.max_hp.to_bytes(4, "big"))
-            h.update(e.damage.to_bytes(4, "big"))
-            h.update(e.state.to_bytes(1, "big"))
-            h.update(e.carrying.to_bytes(4, "big"))
-            h.update(e.jelly_value.to_bytes(4, "big"))
-            h.update(e.sight.to_bytes(4, "big"))
-            h.update(e.cooldown.to_bytes(4, "big"))
-            h.update(e.target_entity_id.to_bytes(4, "big", signed=True))
-            h.update(e.attack_range.to_bytes(4, "big"))
+            pack_into(
+                buf, offset,
+                e.entity_id, e.entity_type, e.player_id,
+                e.x, e.y, e.target_x, e.target_y,
+                e.speed, e.hp, e.max_hp, e.damage, e.state,
+                e.carrying, e.jelly_value, e.sight, e.cooldown,
+                e.target_entity_id, e.attack_range,
+            )
+            offset += size
+        h.update(buf)
         # Visibility grids
         for pid in range(self.visibility.num_players):
             h.update(self.visibility.get_grid_bytes(pid))
@@ -22,8 +22,9 @@ from src.simulation.hive import (
     handle_spawn_ant,
     process_hive_mechanics,
 )
-from src.simulation.pathfinding import find_path
-from src.simulation.state import EntityState, EntityType, GameState
+from src.simulation.spatial import SpatialGrid
+from src.simulation.state import Entity, EntityState, EntityType, GameState
+from src.simulation.tilemap import TileType
 from src.simulation.wildlife import process_wildlife
 
 
@@ -37,83 +38,75 @@ def advance_tick(state: GameState, commands: list[Command]) -> None:
     _process_commands(state, commands)
     process_wildlife(state)
     _check_aggro(state)
-    _check_harvest_aggro(state)
     _update_movement(state)
     _apply_separation(state)
     process_harvesting(state)
     process_combat(state)
     process_hive_mechanics(state)
     # Recompute fog of war for both players
-    state.visibility.update(state.entities, 0)
-    state.visibility.update(state.entities, 1)
+    state.visibility.update_all(state.entities)
     state.tick += 1
 
 
 def _process_commands(state: GameState, commands: list[Command]) -> None:
     """Apply all commands for this tick to the game state."""
+    handlers = _COMMAND_HANDLERS
     for cmd in commands:
-        if cmd.command_type == CommandType.MOVE:
-            _handle_move(state, cmd)
-        elif cmd.command_type == CommandType.STOP:
-            _handle_stop(state, cmd)
-        elif cmd.command_type == CommandType.SPAWN_ANT:
-            handle_spawn_ant(state, cmd)
-        elif cmd.command_type == CommandType.MERGE_QUEEN:
-            handle_merge_queen(state, cmd)
-        elif cmd.command_type == CommandType.FOUND_HIVE:
-            handle_found_hive(state, cmd)
-        elif cmd.command_type == CommandType.ATTACK:
-            _handle_attack(state, cmd)
-        elif cmd.command_type == CommandType.HARVEST:
-            _handle_harvest(state, cmd)
-        elif cmd.command_type == CommandType.MORPH_SPITTER:
-            handle_morph_spitter(state, cmd)
+        handler = handlers.get(cmd.command_type)
+        if handler is not None:
+            handler(state, cmd)
 
 
 def _handle_move(state: GameState, cmd: Command) -> None:
-    """Compute A* path and assign it to entities."""
+    """Assign a path to the target: a straight line if clear, else A*."""
     target_tile_x = cmd.target_x // MILLI_TILES_PER_TILE
     target_tile_y = cmd.target_y // MILLI_TILES_PER_TILE
     final_target_x = cmd.target_x
     final_target_y = cmd.target_y
 
     if not state.tilemap.is_walkable(target_tile_x, target_tile_y):
-        nearest = _find_nearest_walkable(state.tilemap, target_tile_x, target_tile_y)
+        nearest = state.tilemap.nearest_walkable(target_tile_x, target_tile_y)
         if nearest is None:
             return
         target_tile_x, target_tile_y = nearest
         final_target_x = target_tile_x * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2
         final_target_y = target_tile_y * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2
 
+    paths_by_start: dict[tuple[int, int], tuple[tuple[int, int], ...]] = {}
     for entity_id in cmd.entity_ids:
         entity = state.get_entity(entity_id)
         if entity is None or entity.player_id != cmd.player_id:
             continue
 
-        # Compute path from entity's current tile to target tile
-        start_tile_x = entity.x // MILLI_TILES_PER_TILE
-        start_tile_y = entity.y // MILLI_TILES_PER_TILE
-        tile_path = find_path(
-            state.tilemap,
-            start_tile_x, start_tile_y,
-            target_tile_x, target_tile_y,
-        )
+        # Open ground: walk straight to the target and skip A*
+        if _line_walkable(state.tilemap, entity.x, entity.y, final_target_x, final_target_y):
+            entity.path = [(final_target_x, final_target_y)]
+            entity.path_idx = 0
+            entity.target_x = final_target_x
+            entity.target_y = final_target_y
+            continue
 
-        if not tile_path:
+        # Compute path from entity's current tile to target tile, once per
+        # start tile: units grouped in a tile share one (never mutated) path
+        start_tile = (entity.x // MILLI_TILES_PER_TILE, entity.y // MILLI_TILES_PER_TILE)
+        milli_path = paths_by_start.get(start_tile)
+        if milli_path is None:
+            milli_path = paths_by_start[start_tile] = state.path_cache.find_milli_path(
+                state.tilemap,
+                start_tile[0], start_tile[1],
+                target_tile_x, target_tile_y,
+            )
+
+        if not milli_path:
             # No path found (or already at target tile) — just set direct target
             entity.target_x = final_target_x
             entity.target_y = final_target_y
             entity.path = []
+            entity.path_idx = 0
             continue
 
-        # Convert tile waypoints to milli-tile centers
-        milli_path = [
-            (tx * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2,
-             ty * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2)
-            for tx, ty in tile_path
-        ]
-
         entity.path = milli_path
+        entity.path_idx = 0
         # Set target to final destination for renderer target indicator
         entity.target_x = milli_path[-1][0]
         entity.target_y = milli_path[-1][1]
@@ -127,6 +120,7 @@ def _handle_stop(state: GameState, cmd: Command) -> None:
             entity.target_x = entity.x
             entity.target_y = entity.y
             entity.path = []
+            entity.path_idx = 0
 
 
 def _handle_attack(state: GameState, cmd: Command) -> None:
@@ -138,6 +132,8 @@ def _handle_attack(state: GameState, cmd: Command) -> None:
     target_tile_x = target.x // MILLI_TILES_PER_TILE
     target_tile_y = target.y // MILLI_TILES_PER_TILE
 
+    # One path per start tile, shared by the units starting there
+    paths_by_start: dict[tuple[int, int], tuple[tuple[int, int], ...]] = {}
     for entity_id in cmd.entity_ids:
         entity = state.get_entity(entity_id)
         if entity is None or entity.player_id != cmd.player_id:
@@ -147,26 +143,24 @@ def _handle_attack(state: GameState, cmd: Command) -> None:
 
         entity.target_entity_id = target.entity_id
 
-        start_tile_x = entity.x // MILLI_TILES_PER_TILE
-        start_tile_y = entity.y // MILLI_TILES_PER_TILE
-        tile_path = find_path(
-            state.tilemap,
-            start_tile_x, start_tile_y,
-            target_tile_x, target_tile_y,
-        )
+        start_tile = (entity.x // MILLI_TILES_PER_TILE, entity.y // MILLI_TILES_PER_TILE)
+        milli_path = paths_by_start.get(start_tile)
+        if milli_path is None:
+            milli_path = paths_by_start[start_tile] = state.path_cache.find_milli_path(
+                state.tilemap,
+                start_tile[0], start_tile[1],
+                target_tile_x, target_tile_y,
+            )
 
-        if not tile_path:
+        if not milli_path:
             entity.target_x = target.x
             entity.target_y = target.y
             entity.path = []
+            entity.path_idx = 0
             continue
 
-        milli_path = [
-            (tx * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2,
-             ty * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2)
-            for tx, ty in tile_path
-        ]
         entity.path = milli_path
+        entity.path_idx = 0
         entity.target_x = milli_path[-1][0]
         entity.target_y = milli_path[-1][1]
 
@@ -185,15 +179,15 @@ def _handle_harvest(state: GameState, cmd: Command) -> None:
     target_tile_y = goal_y // MILLI_TILES_PER_TILE
 
     if not state.tilemap.is_walkable(target_tile_x, target_tile_y):
-        nearest = _find_nearest_walkable(
-            state.tilemap, target_tile_x, target_tile_y,
-        )
+        nearest = state.tilemap.nearest_walkable(target_tile_x, target_tile_y)
         if nearest is None:
             return
         target_tile_x, target_tile_y = nearest
         goal_x = target_tile_x * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2
         goal_y = target_tile_y * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2
 
+    # One path per start tile, shared by the units starting there
+    paths_by_start: dict[tuple[int, int], tuple[tuple[int, int], ...]] = {}
     for entity_id in cmd.entity_ids:
         entity = state.get_entity(entity_id)
         if entity is None or entity.player_id != cmd.player_id:
@@ -205,24 +199,22 @@ def _handle_harvest(state: GameState, cmd: Command) -> None:
         if cmd.target_entity_id >= 0:
             entity.target_entity_id = cmd.target_entity_id
 
-        start_tile_x = entity.x // MILLI_TILES_PER_TILE
-        start_tile_y = entity.y // MILLI_TILES_PER_TILE
-        tile_path = find_path(
-            state.tilemap,
-            start_tile_x, start_tile_y,
-            target_tile_x, target_tile_y,
-        )
-        if not tile_path:
+        start_tile = (entity.x // MILLI_TILES_PER_TILE, entity.y // MILLI_TILES_PER_TILE)
+        milli_path = paths_by_start.get(start_tile)
+        if milli_path is None:
+            milli_path = paths_by_start[start_tile] = state.path_cache.find_milli_path(
+                state.tilemap,
+                start_tile[0], start_tile[1],
+                target_tile_x, target_tile_y,
+            )
+        if not milli_path:
             entity.target_x = goal_x
             entity.target_y = goal_y
             entity.path = []
+            entity.path_idx = 0
         else:
-            milli_path = [
-                (tx * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2,
-                 ty * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2)
-                for tx, ty in tile_path
-            ]
             entity.path = milli_path
+            entity.path_idx = 0
             entity.target_x = milli_path[-1][0]
             entity.target_y = milli_path[-1][1]
 
@@ -232,102 +224,99 @@ _AGGRO_TARGETS = frozenset({
     EntityType.APHID, EntityType.BEETLE, EntityType.MANTIS,
 })
 
+# _AGGRO_TARGETS membership indexed by entity type, for the per-entity check
+_IS_AGGRO_TARGET = [t in _AGGRO_TARGETS for t in range(max(EntityType) + 1)]
 
-def _check_aggro(state: GameState) -> None:
-    """Divert attack-mode units to closer enemies within aggro range.
+# Cell size of the aggro target grid: an ant's aggro range (sight / 4) is
+# 3 tiles, so a query covers 3x3 cells
+_AGGRO_CELL_MT = 3 * MILLI_TILES_PER_TILE
 
-    Only applies to entities with target_entity_id set (given an ATTACK
-    command). If a closer enemy enters 25% of their sight range, they
-    redirect to attack it instead.
-    """
-    for entity in state.entities:
-        if entity.target_entity_id == -1:
-            continue
-        if entity.damage <= 0:
-            continue
-        if not entity.is_moving and not entity.path:
-            continue
 
-        aggro_range_mt = entity.sight * MILLI_TILES_PER_TILE // 4
-        aggro_range_sq = aggro_range_mt * aggro_range_mt
-
-        best_enemy = None
-        best_dist_sq = aggro_range_sq + 1
-
-        for other in state.entities:
-            if other.entity_type not in _AGGRO_TARGETS:
-                continue
-            if other.hp <= 0:
-                continue
-            if other.player_id == entity.player_id:
-                continue
-            if entity.player_id == -1 and other.player_id == -1:
-                continue
+def _check_aggro(state: GameState) -> None:
+    """Divert moving units to closer enemies or corpses within aggro range.
 
-            dx = entity.x - other.x
-            dy = entity.y - other.y
-            dist_sq = dx * dx + dy * dy
-            if dist_sq < best_dist_sq:
-                best_dist_sq = dist_sq
-                best_enemy = other
+    One pass over the mobile entities covers both kinds of retargeting:
 
-        if best_enemy is None or best_enemy.entity_id == entity.target_entity_id:
-            continue
+    - Attack aggro applies to entities with target_entity_id set (given an
+      ATTACK command). If a closer enemy enters 25% of their sight range,
+      they redirect to attack it instead.
+    - Harvest aggro applies to entities with state == HARVESTING that
+      carry nothing. If a corpse enters 25% of their sight range, they
+      redirect to harvest it.
 
-        # Divert to the closer enemy
-        entity.target_entity_id = best_enemy.entity_id
-        target_tile_x = best_enemy.x // MILLI_TILES_PER_TILE
-        target_tile_y = best_enemy.y // MILLI_TILES_PER_TILE
-        start_tile_x = entity.x // MILLI_TILES_PER_TILE
-        start_tile_y = entity.y // MILLI_TILES_PER_TILE
-        tile_path = find_path(
-            state.tilemap,
-            start_tile_x, start_tile_y,
-            target_tile_x, target_tile_y,
-        )
-        if not tile_path:
-            entity.target_x = best_enemy.x
-            entity.target_y = best_enemy.y
-            entity.path = []
-        else:
-            milli_path = [
-                (tx * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2,
-                 ty * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2)
-                for tx, ty in tile_path
-            ]
-            entity.path = milli_path
-            entity.target_x = milli_path[-1][0]
-            entity.target_y = milli_path[-1][1]
+    A unit can qualify for both (harvesters have a target and damage);
+    attack aggro is checked first, then harvest aggro, as when these were
+    separate passes. Diverting only changes the unit itself, so visiting
+    each unit once gives the same result.
+    """
+    # Candidate targets, bucketed so each unit only checks its
+    # neighbourhood; built on first use (the pass never changes them)
+    grid: SpatialGrid[tuple[int, int, int, int, Entity]] | None = None
 
+    tile_mt = MILLI_TILES_PER_TILE
+    harvesting = EntityState.HARVESTING
 
-def _check_harvest_aggro(state: GameState) -> None:
-    """Auto-divert harvesting entities to nearby corpses within aggro range.
+    # Only units that can move are ever moving or following a path
+    for entity in state.mobile_entities:
+        if not entity.is_moving and not entity.path:
+            continue
+        aggro_range_mt = entity.sight * tile_mt // 4
+        aggro_range_sq = aggro_range_mt * aggro_range_mt
+        ex = entity.x
+        ey = entity.y
+
+        if entity.target_entity_id != -1 and entity.damage > 0:
+            if grid is None:
+                grid = SpatialGrid(_AGGRO_CELL_MT)
+                is_target = _IS_AGGRO_TARGET
+                for other in state.entities:
+                    if is_target[other.entity_type] and other.hp > 0:
+                        grid.insert(
+                            other.x, other.y,
+                            (other.x, other.y, other.player_id, other.entity_id, other),
+                        )
+
+            best_enemy = None
+            best_id = -1
+            best_dist_sq = aggro_range_sq + 1
+            pid = entity.player_id
+
+            for bucket in grid.buckets(ex, ey, aggro_range_mt):
+                for ox, oy, other_pid, other_id, other in bucket:
+                    if other_pid == pid:
+                        continue
+                    if pid == -1 and other_pid == -1:
+                        continue
+
+                    dx = ex - ox
+                    dy = ey - oy
+                    dist_sq = dx * dx + dy * dy
+                    # Nearest wins, ties to the lowest entity_id
+                    if dist_sq < best_dist_sq or (dist_sq == best_dist_sq and other_id < best_id):
+                        best_dist_sq = dist_sq
+                        best_id = other_id
+                        best_enemy = other
+
+            if best_enemy is not None and best_id != entity.target_entity_id:
+                _divert(state, entity, best_enemy)
+                # The divert may have ended the unit's movement
+                if not entity.is_moving and not entity.path:
+                    continue
 
-    Only applies to entities with state == HARVESTING. If a corpse enters
-    25% of their sight range, they redirect to harvest it.
-    """
-    for entity in state.entities:
-        if entity.state != EntityState.HARVESTING:
+        if entity.state != harvesting:
             continue
         if entity.carrying > 0:
             continue  # returning to hive with jelly, don't divert
-        if not entity.is_moving and not entity.path:
-            continue
-
-        aggro_range_mt = entity.sight * MILLI_TILES_PER_TILE // 4
-        aggro_range_sq = aggro_range_mt * aggro_range_mt
 
         best_corpse = None
         best_dist_sq = aggro_range_sq + 1
 
-        for other in state.entities:
-            if other.entity_type != EntityType.CORPSE:
-                continue
+        for other in state.corpses:
             if other.hp <= 0:
                 continue
 
-            dx = entity.x - other.x
-            dy = entity.y - other.y
+            dx = ex - other.x
+            dy = ey - other.y
             dist_sq = dx * dx + dy * dy
             if dist_sq < best_dist_sq:
                 best_dist_sq = dist_sq
@@ -337,114 +326,202 @@ def _check_harvest_aggro(state: GameState) -> None:
             continue
         if best_corpse.entity_id == entity.target_entity_id:
             continue
-
-        entity.target_entity_id = best_corpse.entity_id
-        target_tile_x = best_corpse.x // MILLI_TILES_PER_TILE
-        target_tile_y = best_corpse.y // MILLI_TILES_PER_TILE
-        start_tile_x = entity.x // MILLI_TILES_PER_TILE
-        start_tile_y = entity.y // MILLI_TILES_PER_TILE
-        tile_path = find_path(
-            state.tilemap,
-            start_tile_x, start_tile_y,
-            target_tile_x, target_tile_y,
-        )
-        if not tile_path:
-            entity.target_x = best_corpse.x
-            entity.target_y = best_corpse.y
-            entity.path = []
-        else:
-            milli_path = [
-                (tx * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2,
-                 ty * MILLI_TILES_PER_TILE + MILLI_TILES_PER_TILE // 2)
-                for tx, ty in tile_path
-            ]
-            entity.path = milli_path
-            entity.target_x = milli_path[-1][0]
-            entity.target_y = milli_path[-1][1]
+        _divert(state, entity, best_corpse)
+
+
+def _divert(state: GameState, entity: Entity, target: Entity) -> None:
+    """Retarget a unit at another entity and path to it (aggro diversion)."""
+    entity.target_entity_id = target.entity_id
+    tile_mt = MILLI_TILES_PER_TILE
+    milli_path = state.path_cache.find_milli_path(
+        state.tilemap,
+        entity.x // tile_mt, entity.y // tile_mt,
+        target.x // tile_mt, target.y // tile_mt,
+    )
+    if not milli_path:
+        entity.target_x = target.x
+        entity.target_y = target.y
+        entity.path = []
+        entity.path_idx = 0
+    else:
+        entity.path = milli_path
+        entity.path_idx = 0
+        entity.target_x = milli_path[-1][0]
+        entity.target_y = milli_path[-1][1]
 
 
 def _update_movement(state: GameState) -> None:
-    """Move all entities along their paths. Integer math only."""
-    for entity in state.entities:
+    """Move all mobile entities along their paths. Integer math only.
+
+    Most units are idle on a given tick, so the is_moving test is inlined
+    and the helpers are bound locally to keep the idle case cheap.
+    """
+    follow_path = _follow_path
+    move_toward = _move_toward
+    for entity in state.mobile_entities:
         if entity.path:
-            _follow_path(entity)
-        elif entity.is_moving:
-            # Direct movement (no path) — move straight toward target
-            _move_toward(entity, entity.target_x, entity.target_y)
+            follow_path(entity)
+        else:
+            tx = entity.target_x
+            ty = entity.target_y
+            if entity.x != tx or entity.y != ty:
+                # Direct movement (no path) — move straight toward target
+                move_toward(entity, tx, ty)
 
 
 def _follow_path(entity) -> None:
-    """Move entity toward the next waypoint in its path."""
-    wx, wy = entity.path[0]
-    _move_toward(entity, wx, wy)
-
-    # Check if we reached the waypoint (within speed distance)
-    dx = wx - entity.x
-    dy = wy - entity.y
-    dist_sq = dx * dx + dy * dy
-    if dist_sq <= entity.speed * entity.speed:
-        # Snap to waypoint and pop it
+    """Move entity toward the next waypoint in its path.
+
+    path_idx is the next waypoint; advancing it instead of popping the
+    head keeps this O(1) for long paths. The path is cleared on arrival.
+
+    The per-tick step toward a waypoint and the distance left are cached
+    in path_step, keyed by the position and waypoint they were computed
+    for, so an unobstructed leg takes one isqrt instead of two per tick.
+    Any other change of position (e.g. a separation push) or waypoint
+    misses the cache and re-aims from the current position.
+    """
+    wx, wy = entity.path[entity.path_idx]
+    x = entity.x
+    y = entity.y
+    speed = entity.speed
+    step = entity.path_step
+    if step and step[0] == x and step[1] == y and step[2] == wx and step[3] == wy:
+        step_x, step_y, left = step[4], step[5], step[6]
+    else:
+        dx = wx - x
+        dy = wy - y
+        # Axis-aligned legs (common between tile centres) need no isqrt;
+        # the step is exactly +-speed, as the general formula would give
+        if dx == 0:
+            left = dy if dy >= 0 else -dy
+            step_x = 0
+            step_y = speed if dy > 0 else -speed
+        elif dy == 0:
+            left = dx if dx >= 0 else -dx
+            step_x = speed if dx > 0 else -speed
+            step_y = 0
+        else:
+            left = isqrt(dx * dx + dy * dy)
+            if left > speed:
+                step_x = dx * speed // left
+                step_y = dy * speed // left
+
+    if left > speed:
+        x += step_x
+        y += step_y
+        left -= speed
+
+    # Reached the waypoint (within speed distance): snap and advance past it
+    if left <= speed:
         entity.x = wx
         entity.y = wy
-        entity.path.pop(0)
+        entity.path_step = ()
+        entity.path_idx += 1
 
-        # If path is now empty, we've arrived
-        if not entity.path:
+        # If that was the last waypoint, we've arrived
+        if entity.path_idx >= len(entity.path):
+            entity.path = []
+            entity.path_idx = 0
             entity.target_x = entity.x
             entity.target_y = entity.y
+        return
+
+    entity.x = x
+    entity.y = y
+    entity.path_step = (x, y, wx, wy, step_x, step_y, left)
 
 
 def _move_toward(entity, goal_x: int, goal_y: int) -> None:
-    """Move entity one step toward (goal_x, goal_y)."""
+    """Move entity one step toward (goal_x, goal_y).
+
+    Snaps to the goal once isqrt(distance squared) <= speed, i.e. when
+    the squared distance is below (speed + 1)^2, which is tested before
+    taking the root. Axis-aligned steps are exactly +-speed, so only
+    diagonal moves need the isqrt.
+    """
     dx = goal_x - entity.x
     dy = goal_y - entity.y
-    dist_sq = dx * dx + dy * dy
-    dist = isqrt(dist_sq)
-
-    if dist == 0:
+    if dx == 0 and dy == 0:
         return
 
-    if dist <= entity.speed:
+    speed = entity.speed
+    if dx * dx + dy * dy < (speed + 1) * (speed + 1):
         entity.x = goal_x
         entity.y = goal_y
+    elif dx == 0:
+        entity.y += speed if dy > 0 else -speed
+    elif dy == 0:
+        entity.x += speed if dx > 0 else -speed
     else:
-        entity.x += dx * entity.speed // dist
-        entity.y += dy * entity.speed // dist
+        dist = isqrt(dx * dx + dy * dy)
+        entity.x += dx * speed // dist
+        entity.y += dy * speed // dist
 
 
-_BFS_DIRS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
 _SEP_RADIUS_SQ = SEPARATION_RADIUS * SEPARATION_RADIUS
 
 
-def _find_nearest_walkable(tilemap, tile_x: int, tile_y: int) -> tuple[int, int] | None:
-    """BFS outward from a non-walkable tile to find the nearest walkable one."""
-    visited = {(tile_x, tile_y)}
-    current = [(tile_x, tile_y)]
+def _line_walkable(tilemap, x0: int, y0: int, x1: int, y1: int) -> bool:
+    """Check that the segment between two milli-tile points crosses only walkable tiles.
 
-    for _ in range(15):
-        next_layer: list[tuple[int, int]] = []
-        candidates: list[tuple[int, int]] = []
-        for x, y in current:
-            for dx, dy in _BFS_DIRS:
-                nx, ny = x + dx, y + dy
-                if (nx, ny) in visited:
-                    continue
-                visited.add((nx, ny))
-                if tilemap.is_walkable(nx, ny):
-                    candidates.append((nx, ny))
-                else:
-                    next_layer.append((nx, ny))
-        if candidates:
-            # Pick closest to original target; tie-break by (y, x)
-            return min(
-                candidates,
-                key=lambda p: ((p[0] - tile_x) ** 2 + (p[1] - tile_y) ** 2, p[1], p[0]),
-            )
-        current = next_layer
-        if not current:
-            break
+    Visits every tile the segment touches, in order (integer grid
+    traversal). Where it passes exactly through a tile corner, both
+    tiles beside the corner must be walkable too — the same no-corner-
+    cutting rule A* follows.
+    """
+    tile_mt = MILLI_TILES_PER_TILE
+    tx = x0 // tile_mt
+    ty = y0 // tile_mt
+    end_tx = x1 // tile_mt
+    end_ty = y1 // tile_mt
+    if not tilemap.is_walkable(tx, ty):
+        return False
+
+    dx = x1 - x0
+    dy = y1 - y0
+    adx = abs(dx)
+    ady = abs(dy)
+    step_x = 1 if dx > 0 else -1
+    step_y = 1 if dy > 0 else -1
+    # Distance along each axis to the next tile boundary; the segment
+    # crosses whichever boundary comes first, compared by cross-multiplying
+    if dx > 0:
+        next_x = (tx + 1) * tile_mt - x0
+    elif dx < 0:
+        next_x = x0 - tx * tile_mt
+    else:
+        next_x = tile_mt
+    if dy > 0:
+        next_y = (ty + 1) * tile_mt - y0
+    elif dy < 0:
+        next_y = y0 - ty * tile_mt
+    else:
+        next_y = tile_mt
 
-    return None
+    while tx != end_tx or ty != end_ty:
+        if tx == end_tx:
+            order = 1
+        elif ty == end_ty:
+            order = -1
+        else:
+            order = next_x * ady - next_y * adx
+        if order < 0:
+            tx += step_x
+            next_x += tile_mt
+        elif order > 0:
+            ty += step_y
+            next_y += tile_mt
+        else:
+            if not tilemap.is_walkable(tx + step_x, ty) or not tilemap.is_walkable(tx, ty + step_y):
+                return False
+            tx += step_x
+            ty += step_y
+            next_x += tile_mt
+            next_y += tile_mt
+        if not tilemap.is_walkable(tx, ty):
+            return False
+    return True
 
 
 def _apply_separation(state: GameState) -> None:
@@ -453,58 +530,79 @@ def _apply_separation(state: GameState) -> None:
     Computes all pushes from a snapshot, then applies — so ordering
     doesn't matter and both peers get identical results.
     """
-    entities = state.entities
-    n = len(entities)
     tilemap = state.tilemap
 
-    # Phase 1: compute pushes from snapshot positions
-    pushes: list[tuple[int, int]] = [(0, 0)] * n
-
-    for i in range(n):
-        ei = entities[i]
-        if ei.speed == 0:
-            continue
-
+    # Snapshot the mobile entities' positions as flat records, so the
+    # pairwise loop runs on tuples instead of entity attribute lookups,
+    # bucketed so each entity only checks its neighbourhood. Pushes are
+    # summed, so the order neighbours are visited in does not matter
+    mobile = state.mobile_entities
+    snapshot = [(e.x, e.y, e.entity_id) for e in mobile]
+    grid: SpatialGrid[tuple[int, int, int]] = SpatialGrid(SEPARATION_RADIUS)
+    for record in snapshot:
+        grid.insert(record[0], record[1], record)
+
+    # Phase 1: compute pushes from snapshot positions. Constants and
+    # functions used in the inner loop are bound to locals
+    pushes: list[tuple[int, int]] = []
+    force = SEPARATION_FORCE
+    radius = SEPARATION_RADIUS
+    radius_sq = _SEP_RADIUS_SQ
+    buckets = grid.buckets
+    _isqrt = isqrt
+
+    for xi, yi, id_i in snapshot:
         px, py = 0, 0
-        for j in range(n):
-            if i == j:
-                continue
-            ej = entities[j]
-            if ej.speed == 0:
-                continue
+        for bucket in buckets(xi, yi, radius):
+            for xj, yj, id_j in bucket:
+                if id_j == id_i:
+                    continue
 
-            dx = ei.x - ej.x
-            dy = ei.y - ej.y
-            dist_sq = dx * dx + dy * dy
+                dx = xi - xj
+                dy = yi - yj
+                dist_sq = dx * dx + dy * dy
 
-            if dist_sq >= _SEP_RADIUS_SQ:
-                continue
+                if dist_sq >= radius_sq:
+                    continue
 
-            if dist_sq == 0:
-                # Exact overlap — deterministic tiebreaker using entity_id
-                if ei.entity_id > ej.entity_id:
-                    px += SEPARATION_FORCE
-                else:
-                    px -= SEPARATION_FORCE
-                continue
+                if dist_sq == 0:
+                    # Exact overlap — deterministic tiebreaker using entity_id
+                    px += force if id_i > id_j else -force
+                    continue
 
-            dist = isqrt(dist_sq)
-            # Push proportional to force, in direction away from neighbor
-            px += dx * SEPARATION_FORCE // dist
-            py += dy * SEPARATION_FORCE // dist
+                dist = _isqrt(dist_sq)
+                # Push proportional to force, in direction away from neighbor
+                px += dx * force // dist
+                py += dy * force // dist
 
-        pushes[i] = (px, py)
+        pushes.append((px, py))
 
-    # Phase 2: apply pushes, checking walkability
-    for i in range(n):
-        px, py = pushes[i]
+    # Phase 2: apply pushes, checking walkability straight from the tile list
+    width = tilemap.width
+    height = tilemap.height
+    tiles = tilemap.tiles
+    dirt = int(TileType.DIRT)
+    tile_mt = MILLI_TILES_PER_TILE
+    for ei, (px, py) in zip(mobile, pushes):
         if px == 0 and py == 0:
             continue
-        ei = entities[i]
         new_x = ei.x + px
         new_y = ei.y + py
-        tile_x = new_x // MILLI_TILES_PER_TILE
-        tile_y = new_y // MILLI_TILES_PER_TILE
-        if tilemap.is_walkable(tile_x, tile_y):
+        tile_x = new_x // tile_mt
+        tile_y = new_y // tile_mt
+        if 0 <= tile_x < width and 0 <= tile_y < height and tiles[tile_y * width + tile_x] == dirt:
             ei.x = new_x
             ei.y = new_y
+
+
+# Command type -> handler, looked up once per command by _process_commands
+_COMMAND_HANDLERS = {
+    CommandType.MOVE: _handle_move,
+    CommandType.STOP: _handle_stop,
+    CommandType.SPAWN_ANT: handle_spawn_ant,
+    CommandType.MERGE_QUEEN: handle_merge_queen,
+    CommandType.FOUND_HIVE: handle_found_hive,
+    CommandType.ATTACK: _handle_attack,
+    CommandType.HARVEST: _handle_harvest,
+    CommandType.MORPH_SPITTER: handle_morph_spitter,
+}
@@ -15,33 +15,113 @@ class TileType(IntEnum):
     ROCK = 1
 
 
+# Plain ints for byte comparisons in hot paths
+_DIRT = int(TileType.DIRT)
+_ROCK = int(TileType.ROCK)
+
+# nearest_walkable() table markers: not computed yet / no walkable tile in range
+_NEAREST_UNKNOWN = -1
+_NEAREST_NONE = -2
+_NEAREST_MAX_RINGS = 15
+
+
 class TileMap:
     """2D tile grid for the game map.
 
-    Tiles are stored in a flat list, row-major: tiles[y * width + x].
+    Tiles are stored in a flat bytearray, row-major: tiles[y * width + x],
+    one TileType value per byte.
+    ``version`` is bumped by every set_tile() so caches derived from the
+    terrain (e.g. PathCache, the nearest-walkable table) can tell when
+    they are stale.
     """
 
     def __init__(self, width: int, height: int) -> None:
         self.width = width
         self.height = height
-        self.tiles: list[int] = [TileType.DIRT] * (width * height)
+        self.tiles = bytearray(width * height)  # all DIRT
         self.start_positions: list[tuple[int, int]] = []
         self.hive_site_positions: list[tuple[int, int]] = []
-
-    def get_tile(self, x: int, y: int) -> TileType:
-        """Get tile type at (x, y). Out-of-bounds returns ROCK."""
+        self.version = 0
+        self._bytes_version = -1
+        self._bytes = b""
+        self._nearest_version = -1
+        self._nearest: list[int] = []
+
+    def get_tile(self, x: int, y: int) -> int:
+        """Get the TileType value at (x, y). Out-of-bounds returns ROCK."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return TileType(self.tiles[y * self.width + x])
+            return self.tiles[y * self.width + x]
         return TileType.ROCK
 
     def set_tile(self, x: int, y: int, tile_type: TileType) -> None:
         """Set tile type at (x, y). Ignores out-of-bounds."""
         if 0 <= x < self.width and 0 <= y < self.height:
             self.tiles[y * self.width + x] = tile_type
+            self.version += 1
+
+    def tile_bytes(self) -> bytes:
+        """The tiles as bytes (one per tile), for state hashing.
+
+        Terrain rarely changes, so the bytes are reused until the next
+        set_tile() bumps ``version``.
+        """
+        if self._bytes_version != self.version:
+            self._bytes = bytes(self.tiles)
+            self._bytes_version = self.version
+        return self._bytes
+
+    def nearest_walkable(self, x: int, y: int) -> tuple[int, int] | None:
+        """Find the walkable tile nearest to (x, y), or None within 15 rings.
+
+        Searches square rings of growing radius around the tile and picks
+        the closest candidate in the first ring that has any; ties go to
+        the lowest (y, x). Answers for in-bounds tiles are memoized in a
+        flat table until the next set_tile() bumps ``version``.
+        """
+        width = self.width
+        in_bounds = 0 <= x < width and 0 <= y < self.height
+        if in_bounds:
+            if self._nearest_version != self.version:
+                self._nearest = [_NEAREST_UNKNOWN] * (width * self.height)
+                self._nearest_version = self.version
+            cached = self._nearest[y * width + x]
+            if cached != _NEAREST_UNKNOWN:
+                return None if cached == _NEAREST_NONE else (cached % width, cached // width)
+
+        found = self._search_nearest_walkable(x, y)
+        if in_bounds:
+            self._nearest[y * width + x] = (
+                _NEAREST_NONE if found is None else found[1] * width + found[0]
+            )
+        return found
+
+    def _search_nearest_walkable(self, x: int, y: int) -> tuple[int, int] | None:
+        """Ring search behind nearest_walkable()."""
+        is_walkable = self.is_walkable
+        for r in range(1, _NEAREST_MAX_RINGS + 1):
+            best: tuple[int, int, int] | None = None
+            for ny in range(y - r, y + r + 1):
+                # Interior rows of the ring only have their two end tiles
+                step = 1 if ny in (y - r, y + r) else 2 * r
+                for nx in range(x - r, x + r + 1, step):
+                    if is_walkable(nx, ny):
+                        key = ((nx - x) ** 2 + (ny - y) ** 2, ny, nx)
+                        if best is None or key < best:
+                            best = key
+            if best is not None:
+                return best[2], best[1]
+        return None
 
     def is_walkable(self, x: int, y: int) -> bool:
-        """Check if a tile can be walked on. DIRT is walkable, ROCK is not."""
-        return self.get_tile(x, y) == TileType.DIRT
+        """Check if a tile can be walked on. DIRT is walkable, ROCK is not.
+
+        Out-of-bounds is not walkable. Reads the tile bytes directly
+        rather than going through get_tile().
+        """
+        width = self.width
+        if 0 <= x < width and 0 <= y < self.height:
+            return self.tiles[y * width + x] == _DIRT
+        return False
 
 
 def _lcg_next(state: int) -> tuple[int, int]:
@@ -79,28 +159,31 @@ def generate_map(seed: int, width: int, height: int) -> TileMap:
     # --- Step 2: Cellular automata smoothing (4 iterations) ---
     # Rule: if >= 5 of 9 cells (self + 8 neighbors) are rock, become rock.
     # Produces organic cave-like rock formations.
+    # Only the left half is smoothed, in its own row lists padded with its
+    # left and right neighbours: off-map cells count as rock, and the
+    # column right of the half is still unmirrored dirt from Step 1.
+    # ROCK is 1 and DIRT 0, so a 3x3 count is the sum of three horizontal
+    # 3-cell row sums.
+    right_pad = _DIRT if half_w < width else _ROCK
+    rows = [list(tilemap.tiles[y * width:y * width + half_w]) for y in range(height)]
+    border_sums = [3] * half_w
     for _ in range(4):
-        new_tiles = list(tilemap.tiles)
-        for y in range(height):
-            for x in range(half_w):
-                rock_neighbors = 0
-                for dy in range(-1, 2):
-                    for dx in range(-1, 2):
-                        nx, ny = x + dx, y + dy
-                        if nx < 0 or nx >= width or ny < 0 or ny >= height:
-                            rock_neighbors += 1  # border counts as rock
-                        elif tilemap.tiles[ny * width + nx] == TileType.ROCK:
-                            rock_neighbors += 1
-                if rock_neighbors >= 5:
-                    new_tiles[y * width + x] = TileType.ROCK
-                else:
-                    new_tiles[y * width + x] = TileType.DIRT
-        tilemap.tiles = new_tiles
-
-    # --- Step 3: Mirror left half to right half ---
-    for y in range(height):
-        for x in range(half_w):
-            tilemap.tiles[y * width + (width - 1 - x)] = tilemap.tiles[y * width + x]
+        row_sums = [border_sums]
+        for left in rows:
+            padded = [1, *left, right_pad]
+            row_sums.append([a + b + c for a, b, c in zip(padded, padded[1:], padded[2:])])
+        row_sums.append(border_sums)
+        rows = [
+            [_ROCK if a + b + c >= 5 else _DIRT for a, b, c in zip(above, mid, below)]
+            for above, mid, below in zip(row_sums, row_sums[1:], row_sums[2:])
+        ]
+
+    # --- Step 3: Write the left half and mirror it to the right half ---
+    tiles = tilemap.tiles
+    for y, left in enumerate(rows):
+        row = y * width
+        tiles[row:row + half_w] = bytes(left)
+        tiles[row + width - half_w:row + width] = bytes(reversed(left))
 
     # --- Step 4: Rock border around map edges ---
     for x in range(width):
@@ -11,6 +11,8 @@ of each tick, so the grids stay in sync.
 
 from __future__ import annotations
 
+from math import isqrt
+
 from src.config import MILLI_TILES_PER_TILE
 
 UNEXPLORED = 0
@@ -18,6 +20,23 @@ FOG = 1
 VISIBLE = 2
 
 
+# Byte translation table mapping VISIBLE to FOG, other states unchanged
+_DEMOTE = bytes(FOG if i == VISIBLE else i for i in range(256))
+
+# Sight radius -> half-width of the revealed disk in each row, dy = -r..r
+_disk_spans: dict[int, tuple[int, ...]] = {}
+
+
+def _disk_half_widths(sight: int) -> tuple[int, ...]:
+    """Get the largest |dx| with dx*dx + dy*dy <= sight*sight, per row dy."""
+    spans = _disk_spans.get(sight)
+    if spans is None:
+        sight_sq = sight * sight
+        spans = tuple(isqrt(sight_sq - dy * dy) for dy in range(-sight, sight + 1))
+        _disk_spans[sight] = spans
+    return spans
+
+
 class VisibilityMap:
     """Per-player tile visibility grid."""
 
@@ -29,6 +48,8 @@ class VisibilityMap:
         self._grids: list[bytearray] = [
             bytearray(width * height) for _ in range(num_players)
         ]
+        # Per-player change counters, bumped whenever update() alters a grid
+        self._versions: list[int] = [0] * num_players
 
     def get_visibility(self, player_id: int, x: int, y: int) -> int:
         """Get visibility state of a tile for a player."""
@@ -38,6 +59,43 @@ class VisibilityMap:
             return UNEXPLORED
         return self._grids[player_id][y * self.width + x]
 
+    def get_grid(self, player_id: int) -> bytearray:
+        """Get a player's live grid, indexed [y * width + x].
+
+        For hot read-only loops (rendering) that would otherwise call
+        get_visibility per tile. Callers must bounds-check coordinates
+        and must not modify the grid.
+        """
+        return self._grids[player_id]
+
+    def get_version(self, player_id: int) -> int:
+        """Get a counter that changes whenever the player's grid changes.
+
+        Lets the renderer reuse overlays composed from an unchanged grid.
+        """
+        return self._versions[player_id]
+
+    def get_row(self, player_id: int, y: int, x0: int, x1: int) -> bytes:
+        """Get visibility states of tiles x0..x1-1 in row y as bytes.
+
+        Tiles outside the map (or for an invalid player) read as UNEXPLORED.
+        """
+        n = max(0, x1 - x0)
+        if player_id < 0 or player_id >= self.num_players:
+            return bytes(n)
+        if y < 0 or y >= self.height:
+            return bytes(n)
+        lo = max(x0, 0)
+        hi = min(x1, self.width)
+        if hi <= lo:
+            return bytes(n)
+        row = y * self.width
+        return (
+            bytes(lo - x0)
+            + self._grids[player_id][row + lo:row + hi]
+            + bytes(x1 - hi)
+        )
+
     def update(self, entities: list, player_id: int) -> None:
         """Recompute visibility for a player based on their entity positions.
 
@@ -47,42 +105,66 @@ class VisibilityMap:
         """
         if player_id < 0 or player_id >= self.num_players:
             return
+        self._update_players(entities, (player_id,))
 
-        grid = self._grids[player_id]
-        w = self.width
-        h = self.height
+    def update_all(self, entities: list) -> None:
+        """Recompute visibility for every player in one pass over entities.
 
-        # Demote VISIBLE -> FOG
-        for i in range(len(grid)):
-            if grid[i] == VISIBLE:
-                grid[i] = FOG
+        Same result as calling update() for each player in turn.
+        """
+        self._update_players(entities, range(self.num_players))
 
-        # Reveal tiles around each entity belonging to this player
+    def _update_players(self, entities: list, player_ids) -> None:
+        """Demote and re-reveal the given players' grids."""
+        w = self.width
+        h = self.height
+        grids = self._grids
+
+        # Grid to reveal into, per player id; None for players not updated
+        targets: list[bytearray | None] = [None] * self.num_players
+        befores: list[tuple[int, bytes]] = []
+        for player_id in player_ids:
+            grid = grids[player_id]
+            befores.append((player_id, bytes(grid)))
+            targets[player_id] = grid
+
+            # Demote VISIBLE -> FOG in one pass over the bytes, in place
+            # since get_grid() hands out the live grid
+            grid[:] = grid.translate(_DEMOTE)
+
+        # Reveal tiles around each entity into its owner's grid
+        num_players = self.num_players
+        visible_run = memoryview(bytes([VISIBLE]) * w)
         for entity in entities:
-            if entity.player_id != player_id:
+            player_id = entity.player_id
+            if player_id < 0 or player_id >= num_players:
+                continue
+            grid = targets[player_id]
+            if grid is None:
                 continue
-            if entity.sight <= 0:
+            sight = entity.sight
+            if sight <= 0:
                 continue
 
             # Convert milli-tile position to tile coords
             tx = entity.x // MILLI_TILES_PER_TILE
             ty = entity.y // MILLI_TILES_PER_TILE
-            sight = entity.sight
-            sight_sq = sight * sight
-
-            min_x = max(0, tx - sight)
-            max_x = min(w - 1, tx + sight)
-            min_y = max(0, ty - sight)
-            max_y = min(h - 1, ty + sight)
-
-            for cy in range(min_y, max_y + 1):
-                row = cy * w
-                dy = cy - ty
-                dy_sq = dy * dy
-                for cx in range(min_x, max_x + 1):
-                    dx = cx - tx
-                    if dx * dx + dy_sq <= sight_sq:
-                        grid[row + cx] = VISIBLE
+
+            # Each row of the disk is one contiguous run of tiles, written
+            # as a single slice instead of testing every tile in the square
+            cy = ty - sight
+            for half in _disk_half_widths(sight):
+                if 0 <= cy < h:
+                    lo = max(0, tx - half)
+                    hi = min(w - 1, tx + half)
+                    if lo <= hi:
+                        row = cy * w
+                        grid[row + lo:row + hi + 1] = visible_run[:hi - lo + 1]
+                cy += 1
+
+        for player_id, before in befores:
+            if grids[player_id] != before:
+                self._versions[player_id] += 1
 
     def get_grid_bytes(self, player_id: int) -> bytes:
         """Get raw grid bytes for hashing."""
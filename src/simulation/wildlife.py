@@ -29,8 +29,8 @@ from src.config import (
     WILDLIFE_MAX_MANTIS,
     WILDLIFE_SPAWN_INTERVAL,
 )
-from src.simulation.pathfinding import find_path
-from src.simulation.state import EntityState, EntityType, GameState
+from src.simulation.spatial import SpatialGrid
+from src.simulation.state import Entity, EntityState, EntityType, GameState
 
 # Aggro range in milli-tiles (squared for distance comparison)
 _AGGRO_RANGE_MT = WILDLIFE_AGGRO_RANGE * MILLI_TILES_PER_TILE
@@ -78,7 +78,13 @@ def _update_wildlife_ai(state: GameState) -> None:
     """
     mt = MILLI_TILES_PER_TILE
 
-    for entity in state.entities:
+    # Player-owned entities, the only possible targets, bucketed by the
+    # aggro range so each chaser only checks its neighbourhood; built on
+    # first use (the pass never moves them)
+    grid: SpatialGrid[tuple[int, int, int, Entity]] | None = None
+
+    # Wildlife that can chase has speed > 0, so it is a mobile entity
+    for entity in state.mobile_entities:
         if entity.player_id != -1:
             continue
         if entity.entity_type not in _AGGRESSIVE_TYPES:
@@ -96,15 +102,26 @@ def _update_wildlife_ai(state: GameState) -> None:
         best_target = None
         best_dist_sq = _AGGRO_RANGE_SQ + 1
 
-        for target in state.entities:
-            if target.player_id < 0:
-                continue  # skip wildlife/neutral
-            dx = entity.x - target.x
-            dy = entity.y - target.y
-            dist_sq = dx * dx + dy * dy
-            if dist_sq < best_dist_sq:
-                best_dist_sq = dist_sq
-                best_target = target
+        best_id = -1
+        if grid is None:
+            grid = SpatialGrid(_AGGRO_RANGE_MT)
+            for e in state.entities:
+                if e.player_id >= 0:
+                    grid.insert(e.x, e.y, (e.x, e.y, e.entity_id, e))
+
+        ex = entity.x
+        ey = entity.y
+        for bucket in grid.buckets(ex, ey, _AGGRO_RANGE_MT):
+            for tx, ty, target_id, target in bucket:
+                dx = ex - tx
+                dy = ey - ty
+                dist_sq = dx * dx + dy * dy
+                # Nearest wins, ties to the lowest entity_id (the earliest
+                # entity, as when targets were scanned in entity order)
+                if dist_sq < best_dist_sq or (dist_sq == best_dist_sq and target_id < best_id):
+                    best_dist_sq = dist_sq
+                    best_id = target_id
+                    best_target = target
 
         if best_target is None:
             continue
@@ -115,14 +132,11 @@ def _update_wildlife_ai(state: GameState) -> None:
         goal_tx = best_target.x // mt
         goal_ty = best_target.y // mt
 
-        tile_path = find_path(state.tilemap, start_tx, start_ty, goal_tx, goal_ty)
+        milli_path = state.path_cache.find_milli_path(state.tilemap, start_tx, start_ty, goal_tx, goal_ty)
 
-        if tile_path:
-            milli_path = [
-                (tx * mt + mt // 2, ty * mt + mt // 2)
-                for tx, ty in tile_path
-            ]
+        if milli_path:
             entity.path = milli_path
+            entity.path_idx = 0
             entity.target_x = milli_path[-1][0]
             entity.target_y = milli_path[-1][1]
         else:
@@ -0,0 +1,47 @@
+"""Tests for the renderer's frame presentation."""
+
+import os
+from unittest import mock
+
+import pygame
+import pytest
+
+from src.rendering.renderer import Renderer
+from src.simulation.state import GameState
+from src.simulation.tilemap import TileMap
+
+
+@pytest.fixture
+def screen():
+    """A headless display; sprite baking converts to the display format."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    yield pygame.display.set_mode((640, 480))
+    pygame.font.quit()
+    pygame.display.quit()
+
+
+def _present(renderer: Renderer, state: GameState) -> str:
+    """Present one frame with a still camera; return "flip" or "update"."""
+    with mock.patch.object(pygame.display, "flip") as flip, \
+            mock.patch.object(pygame.display, "update") as update:
+        renderer._present(state, 0, 0, 0)
+    assert flip.called != update.called
+    return "flip" if flip.called else "update"
+
+
+class TestPresent:
+    def test_still_view_updates_dirty_rects_only(self, screen):
+        renderer = Renderer(screen)
+        state = GameState(seed=0, tilemap=TileMap(10, 10))
+        assert _present(renderer, state) == "flip"
+        assert _present(renderer, state) == "update"
+
+    def test_invalidate_forces_a_flip(self, screen):
+        renderer = Renderer(screen)
+        state = GameState(seed=0, tilemap=TileMap(10, 10))
+        _present(renderer, state)
+        renderer.invalidate()
+        assert _present(renderer, state) == "flip"
+        assert _present(renderer, state) == "update"
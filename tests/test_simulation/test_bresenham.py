@@ -0,0 +1,20 @@
+"""Tests for the per-second to per-tick rate distribution."""
+
+from src.config import TICK_RATE
+from src.simulation.bresenham import make_table, per_tick
+
+
+class TestBresenham:
+    def test_table_sums_to_rate(self):
+        for rate in [0, 1, 2, 5, 8, 10, 13, 25]:
+            assert sum(make_table(rate)) == rate
+
+    def test_spread_evenly(self):
+        for rate in [3, 5, 7]:
+            table = make_table(rate)
+            assert max(table) - min(table) <= 1
+
+    def test_per_tick_matches_table(self):
+        table = make_table(7)
+        for tick in range(3 * TICK_RATE):
+            assert per_tick(7, tick) == table[tick % TICK_RATE]
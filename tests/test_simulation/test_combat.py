@@ -7,7 +7,8 @@ from src.config import (
     MILLI_TILES_PER_TILE,
     TICK_RATE,
 )
-from src.simulation.combat import _damage_this_tick, process_combat
+from src.simulation.combat import _damage_this_tick, _nearest_enemy, process_combat
+from src.simulation.spatial import SpatialGrid
 from src.simulation.state import EntityState, EntityType, GameState
 from src.simulation.tick import advance_tick
 
@@ -43,6 +44,35 @@ class TestDamageDistribution:
             assert pattern_a == pattern_b
 
 
+class TestNearestEnemy:
+    """Target search over projected (x, y, player_id, entity_id) records."""
+
+    @staticmethod
+    def _grid(records):
+        grid = SpatialGrid(2 * MILLI_TILES_PER_TILE)
+        for rec in records:
+            grid.insert(rec[0], rec[1], rec)
+        return grid
+
+    def test_picks_nearest_enemy_in_range(self):
+        grid = self._grid([
+            (5000, 5000, 0, 1),   # own unit, ignored
+            (5800, 5000, 1, 2),
+            (5400, 5000, 1, 3),
+            (9000, 5000, 1, 4),   # out of range
+        ])
+        assert _nearest_enemy(grid, 5000, 5000, 0, 1000) == 3
+
+    def test_tie_goes_to_lowest_entity_id(self):
+        grid = self._grid([(5500, 5000, 1, 7), (4500, 5000, 1, 4)])
+        assert _nearest_enemy(grid, 5000, 5000, 0, 1000) == 4
+
+    def test_wildlife_ignores_wildlife(self):
+        grid = self._grid([(5100, 5000, -1, 1)])
+        assert _nearest_enemy(grid, 5000, 5000, -1, 1000) == -1
+        assert _nearest_enemy(grid, 5000, 5000, 0, 1000) == 1
+
+
 class TestAutoAttack:
     """Verify auto-attack targeting and damage."""
 
@@ -87,6 +117,22 @@ class TestAutoAttack:
         assert e1.hp == 20
         assert e2.hp == 20
 
+    def test_corpses_and_hive_sites_not_targeted(self):
+        """Non-attackable types are ignored even when adjacent."""
+        state = GameState(seed=0)
+        ant = state.create_entity(
+            player_id=0, x=BASE_TILE_CENTER_X, y=BASE_TILE_CENTER_Y,
+            damage=10, hp=20, max_hp=20)
+        state.create_entity(
+            player_id=-1, x=BASE_TILE_CENTER_X + 300, y=BASE_TILE_CENTER_Y,
+            entity_type=EntityType.HIVE_SITE, hp=1, max_hp=1)
+        state.create_entity(
+            player_id=-1, x=BASE_TILE_CENTER_X - 300, y=BASE_TILE_CENTER_Y,
+            entity_type=EntityType.CORPSE, hp=50, max_hp=50)
+
+        process_combat(state)
+        assert ant.state != EntityState.ATTACKING
+
     def test_attacks_nearest_enemy(self):
         """Should target the closest enemy when multiple are in range."""
         state = GameState(seed=0)
@@ -52,6 +52,14 @@ class TestCommandQueue:
         assert result[0].player_id == 0  # player 0 always first
         assert result[1].player_id == 1
 
+    def test_equal_keys_keep_arrival_order(self):
+        q = CommandQueue()
+        first = Command(CommandType.MOVE, player_id=0, tick=5, target_x=900)
+        second = Command(CommandType.MOVE, player_id=0, tick=5, target_x=100)
+        q.add(first)
+        q.add(second)
+        assert q.pop_tick(5) == [first, second]
+
     def test_has_tick(self):
         q = CommandQueue()
         assert not q.has_tick(5, player_id=0)
@@ -64,3 +72,16 @@ class TestCommandQueue:
         assert not q.has_tick(5, player_id=1)
         q.mark_empty(5, player_id=1)
         assert q.has_tick(5, player_id=1)
+
+    def test_mark_empty_adds_no_command(self):
+        q = CommandQueue()
+        q.mark_empty(5, player_id=0)
+        assert q.pop_tick(5) == []
+
+    def test_pop_tick_clears_ready_markers(self):
+        q = CommandQueue()
+        q.mark_empty(5, player_id=0)
+        q.add(Command(CommandType.MOVE, player_id=1, tick=5))
+        q.pop_tick(5)
+        assert not q.has_tick(5, player_id=0)
+        assert not q.has_tick(5, player_id=1)
@@ -22,12 +22,14 @@ from src.config import (
 from src.simulation.commands import Command, CommandType
 from src.simulation.hive import (
     _income_this_tick,
+    _spawn_positions,
     handle_found_hive,
     handle_merge_queen,
     handle_spawn_ant,
     process_hive_mechanics,
 )
 from src.simulation.state import EntityState, EntityType, GameState
+from src.simulation.tilemap import TileType
 from src.simulation.tick import advance_tick
 
 # Positions within player 0's starting area (guaranteed walkable for seed=0)
@@ -83,6 +85,19 @@ class TestPassiveIncome:
             state.tick += 1
         assert state.player_jelly[0] == initial_jelly + HIVE_PASSIVE_INCOME * 2
 
+    def test_destroyed_hive_stops_income(self):
+        """Income follows the live hive count, not hives ever built."""
+        state = GameState(seed=0)
+        hive = _make_hive(state, player_id=0, x=BASE_TILE_CENTER_X)
+        _make_hive(state, player_id=0, x=BASE_TILE_CENTER_X + 5000)
+        hive.hp = 0
+        advance_tick(state, [])
+        initial_jelly = state.player_jelly[0]
+        for _ in range(TICK_RATE):
+            process_hive_mechanics(state)
+            state.tick += 1
+        assert state.player_jelly[0] == initial_jelly + HIVE_PASSIVE_INCOME
+
     def test_neutral_site_no_income(self):
         """HIVE_SITE entities should not generate income."""
         state = GameState(seed=0)
@@ -214,6 +229,26 @@ class TestSpawnAnt:
         dy = abs(new_ant.y - hive.y)
         assert dx <= MILLI_TILES_PER_TILE and dy <= MILLI_TILES_PER_TILE
 
+    def test_spawn_positions_follow_terrain_changes(self):
+        """Cached spawn points are recomputed when tiles change."""
+        state = GameState(seed=0)
+        hive = _make_hive(state, player_id=0)
+        hx = hive.x // MILLI_TILES_PER_TILE
+        hy = hive.y // MILLI_TILES_PER_TILE
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                state.tilemap.set_tile(hx + dx, hy + dy, TileType.DIRT)
+        assert _spawn_positions(state, hive.x, hive.y)[0] == (
+            hive.x, hive.y - MILLI_TILES_PER_TILE)
+
+        # Wall off everything but the west tile
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if (dx, dy) not in ((0, 0), (-1, 0)):
+                    state.tilemap.set_tile(hx + dx, hy + dy, TileType.ROCK)
+        west = (hive.x - MILLI_TILES_PER_TILE, hive.y)
+        assert set(_spawn_positions(state, hive.x, hive.y)) == {west}
+
 
 class TestMergeQueen:
     """Verify queen merging from ants."""
@@ -256,6 +291,26 @@ class TestMergeQueen:
         for aid in ant_ids:
             assert state.get_entity(aid) is None
 
+    def test_merge_takes_ants_in_command_order(self):
+        """With spare ants selected, the first QUEEN_MERGE_COST listed merge."""
+        state = GameState(seed=0)
+        hive = _make_hive(state, player_id=0)
+        ant_ids = [
+            _make_ant(state, player_id=0, x=hive.x + i * 100, y=hive.y).entity_id
+            for i in range(QUEEN_MERGE_COST + 1)
+        ]
+        spare = ant_ids[0]
+        cmd = Command(
+            command_type=CommandType.MERGE_QUEEN,
+            player_id=0, tick=0,
+            entity_ids=tuple(ant_ids[1:] + [spare]),
+            target_entity_id=hive.entity_id,
+        )
+        handle_merge_queen(state, cmd)
+        assert state.get_entity(spare) is not None
+        for aid in ant_ids[1:]:
+            assert state.get_entity(aid) is None
+
     def test_merge_rejected_too_few_ants(self):
         """Merge should fail if fewer than QUEEN_MERGE_COST ants."""
         state = GameState(seed=0)
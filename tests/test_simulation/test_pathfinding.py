@@ -1,6 +1,6 @@
 """Tests for A* pathfinding."""
 
-from src.simulation.pathfinding import find_path, CARDINAL_COST, DIAGONAL_COST
+from src.simulation.pathfinding import PathCache, find_path, CARDINAL_COST, DIAGONAL_COST
 from src.simulation.tilemap import TileMap, TileType
 
 
@@ -47,6 +47,13 @@ class TestStraightLinePath:
             assert x == 3 + i
             assert y == 3 + i
 
+    def test_no_wrap_across_map_edge(self):
+        """Stepping off the left edge must not land on the previous row."""
+        tm = _make_open_map()
+        path = find_path(tm, 0, 5, 19, 4)
+        assert path[-1] == (19, 4)
+        assert len(path) == 19
+
 
 class TestPathAroundWall:
     def test_path_goes_around_wall(self):
@@ -168,3 +175,55 @@ class TestStartExcluded:
         assert len(path) > 0
         assert (3, 3) not in path
         assert path[-1] == (6, 3)
+
+
+class TestPathCache:
+    def test_matches_find_path(self):
+        tm = _make_map_with_wall()
+        cache = PathCache()
+        expected = find_path(tm, 5, 5, 15, 5)
+        assert list(cache.find_path(tm, 5, 5, 15, 5)) == expected
+        # Served from the cache the second time
+        assert list(cache.find_path(tm, 5, 5, 15, 5)) == expected
+
+    def test_set_tile_invalidates(self):
+        tm = _make_open_map()
+        cache = PathCache()
+        before = cache.find_path(tm, 2, 5, 8, 5)
+        for y in range(20):
+            if y != 19:
+                tm.set_tile(5, y, TileType.ROCK)
+        after = cache.find_path(tm, 2, 5, 8, 5)
+        assert after != before
+        assert list(after) == find_path(tm, 2, 5, 8, 5)
+
+    def test_new_tilemap_invalidates(self):
+        cache = PathCache()
+        cache.find_path(_make_open_map(), 2, 5, 8, 5)
+        walled = _make_map_with_wall()
+        assert list(cache.find_path(walled, 5, 5, 15, 5)) == find_path(walled, 5, 5, 15, 5)
+
+    def test_bounded_size(self):
+        tm = _make_open_map()
+        cache = PathCache(max_entries=3)
+        for x in range(1, 10):
+            assert list(cache.find_path(tm, 0, 0, x, 0)) == find_path(tm, 0, 0, x, 0)
+        assert len(cache._paths) <= 3
+
+    def test_evicts_least_recently_used(self):
+        tm = _make_open_map()
+        cache = PathCache(max_entries=2)
+        cache.find_path(tm, 0, 0, 1, 0)
+        cache.find_path(tm, 0, 0, 2, 0)
+        cache.find_path(tm, 0, 0, 1, 0)  # refresh the first path
+        cache.find_path(tm, 0, 0, 3, 0)
+        assert list(cache._paths) == [(0, 0, 1, 0), (0, 0, 3, 0)]
+
+    def test_milli_path_is_tile_centers(self):
+        tm = _make_map_with_wall()
+        cache = PathCache()
+        tiles = find_path(tm, 5, 5, 15, 5)
+        milli_path = cache.find_milli_path(tm, 5, 5, 15, 5)
+        assert milli_path == tuple((x * 1000 + 500, y * 1000 + 500) for x, y in tiles)
+        # Repeat requests share one tuple
+        assert cache.find_milli_path(tm, 5, 5, 15, 5) is milli_path
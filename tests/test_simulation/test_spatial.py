@@ -0,0 +1,36 @@
+"""Tests for the spatial hash grid."""
+
+from src.simulation.spatial import SpatialGrid
+
+
+class TestSpatialGrid:
+    def test_query_finds_items_within_radius(self):
+        grid = SpatialGrid(2000)
+        grid.insert(5000, 5000, "near")
+        grid.insert(6000, 5000, "edge")
+        grid.insert(20000, 20000, "far")
+        result = grid.query(5000, 5000, 1000)
+        assert "near" in result
+        assert "edge" in result
+        assert "far" not in result
+
+    def test_query_spans_cell_boundaries(self):
+        grid = SpatialGrid(2000)
+        grid.insert(1999, 1999, "a")
+        grid.insert(2001, 2001, "b")
+        assert sorted(grid.query(2000, 2000, 10)) == ["a", "b"]
+
+    def test_negative_coordinates(self):
+        grid = SpatialGrid(2000)
+        grid.insert(-500, -500, "a")
+        assert grid.query(0, 0, 600) == ["a"]
+
+    def test_bucket_keeps_insertion_order(self):
+        grid = SpatialGrid(2000)
+        for i in range(5):
+            grid.insert(100 * i, 100, i)
+        assert grid.query(200, 100, 0) == [0, 1, 2, 3, 4]
+
+    def test_empty_grid(self):
+        grid = SpatialGrid(1000)
+        assert grid.query(0, 0, 5000) == []
@@ -1,6 +1,7 @@
 """Tests for GameState — determinism, hashing, entity management."""
 
-from src.simulation.state import GameState
+from src.simulation.combat import process_combat
+from src.simulation.state import EntityType, GameState
 
 
 class TestGameStateCreation:
@@ -33,6 +34,93 @@ class TestGameStateCreation:
         assert game_state.get_entity(99) is None
 
 
+class TestRemoveEntities:
+    def test_removes_and_keeps_order(self, game_state: GameState):
+        a = game_state.create_entity(0, 0, 0)
+        b = game_state.create_entity(0, 1000, 0)
+        c = game_state.create_entity(0, 2000, 0)
+        game_state.remove_entities({b.entity_id})
+        assert game_state.entities == [a, c]
+        assert game_state.get_entity(b.entity_id) is None
+        assert game_state.get_entity(c.entity_id) is c
+
+    def test_updates_derived_indexes(self, game_state: GameState):
+        hive = game_state.create_entity(0, 0, 0, entity_type=EntityType.HIVE)
+        queen = game_state.create_entity(0, 0, 0, entity_type=EntityType.QUEEN)
+        corpse = game_state.create_entity(-1, 0, 0, entity_type=EntityType.CORPSE)
+        game_state.remove_entities(
+            {hive.entity_id, queen.entity_id, corpse.entity_id})
+        assert game_state.entities == []
+        assert game_state.hives_by_player[0] == []
+        assert game_state.queens == []
+        assert game_state.corpses == []
+
+    def test_dead_entity_not_found(self, game_state: GameState):
+        ant = game_state.create_entity(0, 0, 0)
+        ant.hp = 0
+        process_combat(game_state)
+        assert game_state.get_entity(ant.entity_id) is None
+
+
+class TestHivesByPlayer:
+    def test_create_entity_tracks_hives(self, game_state: GameState):
+        h0 = game_state.create_entity(0, 0, 0, entity_type=EntityType.HIVE)
+        game_state.create_entity(0, 1000, 0)  # ant, not tracked
+        h1 = game_state.create_entity(1, 2000, 0, entity_type=EntityType.HIVE)
+        h2 = game_state.create_entity(0, 3000, 0, entity_type=EntityType.HIVE)
+        assert game_state.hives_by_player == {0: [h0, h2], 1: [h1]}
+
+    def test_dead_hive_is_dropped(self, game_state: GameState):
+        h0 = game_state.create_entity(0, 0, 0, entity_type=EntityType.HIVE)
+        h1 = game_state.create_entity(0, 5000, 0, entity_type=EntityType.HIVE)
+        h0.hp = 0
+        process_combat(game_state)
+        assert game_state.hives_by_player[0] == [h1]
+
+
+class TestQueens:
+    def test_create_entity_tracks_queens(self, game_state: GameState):
+        game_state.create_entity(0, 0, 0)  # ant, not tracked
+        q = game_state.create_entity(0, 1000, 0, entity_type=EntityType.QUEEN)
+        assert game_state.queens == [q]
+
+    def test_dead_queen_is_dropped(self, game_state: GameState):
+        q0 = game_state.create_entity(0, 0, 0, entity_type=EntityType.QUEEN)
+        q1 = game_state.create_entity(1, 5000, 0, entity_type=EntityType.QUEEN)
+        q0.hp = 0
+        process_combat(game_state)
+        assert game_state.queens == [q1]
+
+
+class TestCorpses:
+    def test_death_adds_corpse_and_decay_drops_it(self, game_state: GameState):
+        ant = game_state.create_entity(0, 0, 0, jelly_value=5)
+        ant.hp = 0
+        process_combat(game_state)
+        (corpse,) = game_state.corpses
+        assert corpse.entity_type == EntityType.CORPSE
+        corpse.hp = 1
+        process_combat(game_state)
+        assert game_state.corpses == []
+
+
+class TestMobileEntities:
+    def test_tracks_entities_with_speed(self, game_state: GameState):
+        a = game_state.create_entity(0, 0, 0)
+        game_state.create_entity(0, 1000, 0, entity_type=EntityType.HIVE, speed=0)
+        b = game_state.create_entity(0, 2000, 0)
+        assert game_state.mobile_entities == [a, b]
+
+    def test_removed_and_dead_are_dropped(self, game_state: GameState):
+        a = game_state.create_entity(0, 0, 0)
+        b = game_state.create_entity(0, 5000, 0)
+        c = game_state.create_entity(0, 9000, 0)
+        game_state.remove_entities({a.entity_id})
+        b.hp = 0
+        process_combat(game_state)
+        assert game_state.mobile_entities == [c]
+
+
 class TestDeterministicPRNG:
     def test_same_seed_same_sequence(self):
         s1 = GameState(seed=42)
@@ -75,3 +163,13 @@ class TestStateHashing:
         s1.tick = 0
         s2.tick = 1
         assert s1.compute_hash() != s2.compute_hash()
+
+    def test_signed_fields_hash(self):
+        """Negative player and target ids are packed as signed ints."""
+        s1 = GameState(seed=42)
+        s2 = GameState(seed=42)
+        e1 = s1.create_entity(player_id=-1, x=-500, y=2000)
+        e2 = s2.create_entity(player_id=-1, x=-500, y=2000)
+        e1.target_entity_id = -1
+        e2.target_entity_id = 0
+        assert s1.compute_hash() != s2.compute_hash()
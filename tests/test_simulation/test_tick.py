@@ -4,8 +4,9 @@ from math import isqrt
 
 from src.config import MILLI_TILES_PER_TILE
 from src.simulation.commands import Command, CommandType
-from src.simulation.state import GameState
-from src.simulation.tick import advance_tick
+from src.simulation.state import EntityState, EntityType, GameState
+from src.simulation.tick import _check_aggro, _line_walkable, advance_tick
+from src.simulation.tilemap import TileMap, TileType
 
 # All test positions must be on walkable tiles. The tilemap for seed=0 has
 # player 0's start at tile (25, 50) with a clear radius of 6, so milli-tile
@@ -40,6 +41,15 @@ class TestDirectMovement:
         assert e.y == BASE_Y
         assert not e.is_moving
 
+    def test_snap_when_rounded_distance_equals_speed(self):
+        state = GameState(seed=0)
+        e = state.create_entity(player_id=0, x=BASE_X, y=BASE_Y, speed=100)
+        # Distance is sqrt(100^2 + 14^2) ~ 100.98, which isqrt rounds to 100
+        e.target_x = BASE_X + 100
+        e.target_y = BASE_Y + 14
+        advance_tick(state, [])
+        assert (e.x, e.y) == (BASE_X + 100, BASE_Y + 14)
+
     def test_diagonal_movement(self):
         state = GameState(seed=0)
         e = state.create_entity(player_id=0, x=BASE_X, y=BASE_Y, speed=100)
@@ -142,6 +152,86 @@ class TestMoveCommand:
         # Entity should now be moving (target changed from original position)
         assert e.target_x != BASE_X or e.target_y != BASE_Y
 
+    def test_move_in_open_ground_goes_straight(self):
+        """A clear straight line needs no A* waypoints."""
+        state = GameState(seed=0)
+        e = state.create_entity(
+            player_id=0, x=BASE_TILE_CENTER_X, y=BASE_TILE_CENTER_Y)
+        cmd = Command(
+            command_type=CommandType.MOVE,
+            player_id=0,
+            tick=0,
+            entity_ids=(e.entity_id,),
+            target_x=BASE_X + 3250,
+            target_y=BASE_Y + 1750,
+        )
+        advance_tick(state, [cmd])
+        assert e.path == [(BASE_X + 3250, BASE_Y + 1750)]
+
+    def test_units_in_one_tile_share_a_path(self):
+        """A squad starting in one tile gets one A* path, shared."""
+        tm = TileMap(10, 10)
+        for y in range(8):
+            tm.set_tile(5, y, TileType.ROCK)
+        state = GameState(seed=0, tilemap=tm)
+        a = state.create_entity(player_id=0, x=2200, y=2200)
+        b = state.create_entity(player_id=0, x=2800, y=2700)
+        cmd = Command(
+            command_type=CommandType.MOVE,
+            player_id=0,
+            tick=0,
+            entity_ids=(a.entity_id, b.entity_id),
+            target_x=8500,
+            target_y=2500,
+        )
+        advance_tick(state, [cmd])
+        assert len(a.path) > 1
+        assert b.path is a.path
+
+    def test_attackers_in_one_tile_share_a_path(self):
+        tm = TileMap(10, 10)
+        for y in range(8):
+            tm.set_tile(5, y, TileType.ROCK)
+        state = GameState(seed=0, tilemap=tm)
+        enemy = state.create_entity(player_id=1, x=8500, y=2500)
+        a = state.create_entity(player_id=0, x=2200, y=2200, damage=5)
+        b = state.create_entity(player_id=0, x=2800, y=2700, damage=5)
+        cmd = Command(
+            command_type=CommandType.ATTACK,
+            player_id=0,
+            tick=0,
+            entity_ids=(a.entity_id, b.entity_id),
+            target_entity_id=enemy.entity_id,
+        )
+        advance_tick(state, [cmd])
+        assert len(a.path) > 1
+        assert b.path is a.path
+
+
+class TestLineWalkable:
+    def test_open_line(self):
+        tm = TileMap(10, 10)
+        assert _line_walkable(tm, 500, 500, 8700, 6200)
+
+    def test_rock_on_line(self):
+        tm = TileMap(10, 10)
+        tm.set_tile(4, 2, TileType.ROCK)
+        assert not _line_walkable(tm, 500, 2500, 8500, 2500)
+
+    def test_segment_clipping_a_rock_tile(self):
+        """A rock touched only briefly between tile centers still blocks."""
+        tm = TileMap(10, 10)
+        tm.set_tile(1, 0, TileType.ROCK)
+        # From (0.5, 0.5) to (2.5, 1.1) the line enters tile (1, 0)
+        assert not _line_walkable(tm, 500, 500, 2500, 1100)
+
+    def test_no_corner_cutting(self):
+        """Passing exactly through a corner needs both side tiles clear."""
+        tm = TileMap(10, 10)
+        tm.set_tile(1, 0, TileType.ROCK)
+        assert not _line_walkable(tm, 500, 500, 1500, 1500)
+        assert _line_walkable(tm, 500, 1500, 1500, 2500)
+
 
 class TestPathFollowing:
     def test_entity_follows_path(self):
@@ -162,8 +252,8 @@ class TestPathFollowing:
         # Entity should have moved toward first waypoint
         assert e.x > BASE_TILE_CENTER_X
 
-    def test_entity_pops_waypoints(self):
-        """Entity should pop waypoints as it reaches them."""
+    def test_entity_advances_waypoints(self):
+        """Entity should advance past waypoints as it reaches them."""
         state = GameState(seed=0)
         # Use high speed so entity reaches waypoints quickly
         e = state.create_entity(
@@ -178,7 +268,20 @@ class TestPathFollowing:
         advance_tick(state, [])
         # With speed=1500, entity should reach first waypoint (1000 away)
         # and move toward second
-        assert len(e.path) < 2  # at least one waypoint popped
+        assert len(e.path) - e.path_idx < 2  # at least one waypoint passed
+
+    def test_pushed_entity_reaims_at_waypoint(self):
+        """A cached step is dropped once something else moves the entity."""
+        state = GameState(seed=0)
+        e = state.create_entity(
+            player_id=0, x=BASE_TILE_CENTER_X, y=BASE_TILE_CENTER_Y, speed=100)
+        e.path = [(BASE_TILE_CENTER_X + 3000, BASE_TILE_CENTER_Y)]
+        e.target_x, e.target_y = e.path[-1]
+        advance_tick(state, [])
+        assert e.y == BASE_TILE_CENTER_Y
+        e.y += 500  # e.g. a separation push
+        advance_tick(state, [])
+        assert e.y < BASE_TILE_CENTER_Y + 500
 
     def test_entity_stops_at_final_waypoint(self):
         """Entity should stop when it reaches the last waypoint."""
@@ -370,3 +473,35 @@ class TestSeparation:
             advance_tick(state, [])
             results.append([(e.x, e.y) for e in state.entities])
         assert results[0] == results[1]
+
+
+class TestAggro:
+    def test_equidistant_enemies_tie_to_lowest_id(self):
+        """Aggro picks the lowest entity_id among equally close enemies."""
+        state = GameState(seed=0, tilemap=TileMap(30, 30))
+        far = state.create_entity(player_id=1, x=25500, y=15500)
+        below = state.create_entity(player_id=1, x=5500, y=17500)
+        above = state.create_entity(player_id=1, x=5500, y=13500)
+        ant = state.create_entity(player_id=0, x=5500, y=15500, damage=5)
+        ant.target_entity_id = far.entity_id
+        ant.target_x, ant.target_y = far.x, far.y
+        _check_aggro(state)
+        assert below.entity_id < above.entity_id
+        assert ant.target_entity_id == below.entity_id
+
+    def test_harvester_checks_corpses_after_enemies(self):
+        """A harvester near an enemy and a corpse ends up on the corpse."""
+        state = GameState(seed=0, tilemap=TileMap(30, 30))
+        corpse = state.create_entity(
+            player_id=-1, x=7500, y=15500, entity_type=EntityType.CORPSE,
+            speed=0, hp=50, max_hp=50,
+        )
+        enemy = state.create_entity(player_id=1, x=3500, y=15500)
+        ant = state.create_entity(player_id=0, x=5500, y=15500, damage=5)
+        ant.state = EntityState.HARVESTING
+        ant.target_entity_id = 999
+        ant.target_x, ant.target_y = 25500, 15500
+        _check_aggro(state)
+        assert enemy.entity_id != ant.target_entity_id
+        assert ant.target_entity_id == corpse.entity_id
+        assert ant.path[-1] == (7500, 15500)
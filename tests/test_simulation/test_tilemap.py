@@ -52,6 +52,31 @@ class TestTileMap:
         # row-major: index = y * width + x = 2 * 5 + 3 = 13
         assert tm.tiles[13] == TileType.ROCK
 
+    def test_tile_bytes_follow_set_tile(self):
+        tm = TileMap(5, 5)
+        assert tm.tile_bytes() == bytes(25)
+        tm.set_tile(3, 2, TileType.ROCK)
+        assert tm.tile_bytes()[13] == TileType.ROCK
+        assert tm.tile_bytes() == bytes(tm.tiles)
+
+    def test_nearest_walkable_follows_set_tile(self):
+        tm = TileMap(10, 10)
+        for x in range(10):
+            tm.set_tile(x, 5, TileType.ROCK)
+            tm.set_tile(x, 6, TileType.ROCK)
+        # Two rings out from (4, 6): row 4 is nearer in ring 1 than ring 2
+        assert tm.nearest_walkable(4, 6) == (4, 7)
+        assert tm.nearest_walkable(4, 5) == (4, 4)
+        tm.set_tile(4, 7, TileType.ROCK)
+        assert tm.nearest_walkable(4, 6) == (3, 7)
+
+    def test_nearest_walkable_none_when_out_of_range(self):
+        tm = TileMap(40, 40)
+        for y in range(40):
+            for x in range(40):
+                tm.set_tile(x, y, TileType.ROCK)
+        assert tm.nearest_walkable(20, 20) is None
+
 
 class TestGenerateMap:
     """Tests for procedural map generation."""
@@ -70,6 +70,16 @@ class TestVisibilityReveal:
         # Diagonal: dx=2, dy=2 -> dist_sq=8, sight_sq=9 -> visible
         assert vm.get_visibility(0, 12, 12) == VISIBLE
 
+    def test_disk_clipped_at_map_edge(self):
+        vm = VisibilityMap(10, 8)
+        entity = _make_entity(player_id=0, tx=1, ty=6, sight=4)
+        vm.update([entity], 0)
+        for y in range(8):
+            for x in range(10):
+                inside = (x - 1) ** 2 + (y - 6) ** 2 <= 16
+                assert vm.get_visibility(0, x, y) == (VISIBLE if inside else UNEXPLORED)
+        assert len(vm.get_grid_bytes(0)) == 80
+
     def test_zero_sight_reveals_nothing(self):
         vm = VisibilityMap(20, 20)
         entity = _make_entity(player_id=0, tx=10, ty=10, sight=0)
@@ -131,6 +141,23 @@ class TestPerPlayer:
         assert vm.get_visibility(1, 10, 10) == UNEXPLORED
 
 
+    def test_update_all_matches_per_player_updates(self):
+        entities = [
+            _make_entity(player_id=0, tx=5, ty=5, sight=3),
+            _make_entity(player_id=1, tx=15, ty=15, sight=4),
+            _make_entity(player_id=-1, tx=10, ty=10, sight=5),
+        ]
+        separate = VisibilityMap(20, 20)
+        combined = VisibilityMap(20, 20)
+        for _ in range(2):
+            separate.update(entities, 0)
+            separate.update(entities, 1)
+            combined.update_all(entities)
+            entities[0] = _make_entity(player_id=0, tx=8, ty=5, sight=3)
+        for pid in (0, 1):
+            assert combined.get_grid_bytes(pid) == separate.get_grid_bytes(pid)
+            assert combined.get_version(pid) == separate.get_version(pid)
+
 class TestMultipleEntities:
     def test_multiple_units_combine_vision(self):
         vm = VisibilityMap(30, 30)
@@ -144,6 +171,43 @@ class TestMultipleEntities:
         assert vm.get_visibility(0, 15, 15) == UNEXPLORED
 
 
+class TestGetGrid:
+    def test_grid_matches_get_visibility(self):
+        vm = VisibilityMap(20, 10)
+        vm.update([_make_entity(0, 4, 6, sight=3)], 0)
+        grid = vm.get_grid(0)
+        for y in range(10):
+            for x in range(20):
+                assert grid[y * 20 + x] == vm.get_visibility(0, x, y)
+
+    def test_grid_is_live(self):
+        vm = VisibilityMap(10, 10)
+        grid = vm.get_grid(0)
+        vm.update([_make_entity(0, 5, 5, sight=1)], 0)
+        assert grid[5 * 10 + 5] == VISIBLE
+
+
+class TestGetRow:
+    def test_row_matches_get_visibility(self):
+        vm = VisibilityMap(20, 20)
+        vm.update([_make_entity(0, 10, 10, sight=3)], 0)
+        row = vm.get_row(0, 10, 0, 20)
+        assert len(row) == 20
+        assert list(row) == [vm.get_visibility(0, x, 10) for x in range(20)]
+
+    def test_out_of_bounds_padded_with_unexplored(self):
+        vm = VisibilityMap(10, 10)
+        vm.update([_make_entity(0, 0, 0, sight=2)], 0)
+        row = vm.get_row(0, 0, -2, 3)
+        assert list(row) == [UNEXPLORED, UNEXPLORED, VISIBLE, VISIBLE, VISIBLE]
+        assert vm.get_row(0, 0, 12, 15) == bytes(3)
+        assert vm.get_row(0, -1, 0, 4) == bytes(4)
+
+    def test_invalid_player_returns_unexplored(self):
+        vm = VisibilityMap(10, 10)
+        assert vm.get_row(-1, 0, 0, 5) == bytes(5)
+
+
 class TestGridBytes:
     def test_get_grid_bytes_length(self):
         vm = VisibilityMap(10, 10)
@@ -154,3 +218,25 @@ class TestGridBytes:
         vm = VisibilityMap(10, 10)
         assert vm.get_grid_bytes(-1) == b""
         assert vm.get_grid_bytes(5) == b""
+
+
+class TestVersion:
+    def test_version_bumps_when_grid_changes(self):
+        vm = VisibilityMap(20, 20)
+        v0 = vm.get_version(0)
+        vm.update([_make_entity(0, 10, 10, sight=3)], 0)
+        assert vm.get_version(0) != v0
+
+    def test_version_unchanged_when_grid_unchanged(self):
+        vm = VisibilityMap(20, 20)
+        entity = _make_entity(0, 10, 10, sight=3)
+        vm.update([entity], 0)
+        v1 = vm.get_version(0)
+        vm.update([entity], 0)
+        assert vm.get_version(0) == v1
+
+    def test_version_is_per_player(self):
+        vm = VisibilityMap(20, 20)
+        v1 = vm.get_version(1)
+        vm.update([_make_entity(0, 10, 10, sight=3)], 0)
+        assert vm.get_version(1) == v1
@@ -212,6 +212,29 @@ class TestWildlifeAI:
         dx_far = abs(final_x - far_ant.x)
         assert dx_close <= dx_far
 
+    def test_beetle_ties_go_to_earliest_entity(self) -> None:
+        state = _make_state()
+        beetle = state.create_entity(
+            player_id=-1, x=10 * MT + MT // 2, y=10 * MT + MT // 2,
+            entity_type=EntityType.BEETLE, speed=BEETLE_SPEED,
+            hp=BEETLE_HP, max_hp=BEETLE_HP, damage=BEETLE_DAMAGE,
+        )
+        # Same distance on either side of a grid cell boundary; the later
+        # entity sits in the cell scanned first
+        right = state.create_entity(
+            player_id=0, x=13 * MT + MT // 2, y=10 * MT + MT // 2,
+            entity_type=EntityType.ANT, speed=400, hp=20, max_hp=20, damage=5,
+        )
+        state.create_entity(
+            player_id=1, x=7 * MT + MT // 2, y=10 * MT + MT // 2,
+            entity_type=EntityType.ANT, speed=400, hp=20, max_hp=20, damage=5,
+        )
+
+        process_wildlife(state)
+
+        final_x, final_y = beetle.path[-1] if beetle.path else (beetle.target_x, beetle.target_y)
+        assert (final_x, final_y) == (right.x, right.y)
+
 
 # ---------------------------------------------------------------------------
 # Wildlife spawning tests